@@ -45,6 +45,7 @@ class Config(Extended, Cog):
             channel.id,
             webhook.id,
         )
+        await self.bot.redis.hdel(f"reskin:webhooks:{entry.guild.id}", str(webhook.id))
         await cache.delete_match(f"reskin:webhook:{entry.guild.id}:{channel.id}")
 
     @group(invoke_without_command=True)
@@ -360,6 +361,9 @@ class Config(Extended, Cog):
             ],
         )
         await cache.delete_match(f"reskin:webhook:{ctx.guild.id}:*")
+        self.bot.webhookless_channels.difference_update(
+            channel.id for channel, _ in webhooks
+        )
 
         if ctx.response:
             await quietly_delete(ctx.response)
@@ -60,10 +60,11 @@ from cogs.config.extended.security.antinuke import Settings
 from main import greedbot
 from tools import (
     convert_image,
+    emoji_name,
     enlarge_emoji,
     quietly_delete,
     strip_roles,
-    unicode_emoji,
+    twemoji_url,
     url_to_mime,
 )
 from tools.client import Context
@@ -3073,7 +3074,7 @@ class Moderation(Cog):
         """
 
         if isinstance(emoji, str):
-            url, name = unicode_emoji(emoji)
+            url, name = twemoji_url(emoji), emoji_name(emoji)
         else:
             url, name = emoji.url, emoji.name
 
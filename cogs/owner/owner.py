@@ -334,6 +334,7 @@ class Owner(
                 user.id,
                 information,
             )
+            self.bot.blacklist.add(user.id)
             for guild in user.mutual_guilds:
                 if guild.owner_id == user.id:
                     await guild.leave()
@@ -342,6 +343,7 @@ class Owner(
                 f"No longer allowing **{user}** to use **{self.bot.user}**"
             )
 
+        self.bot.blacklist.discard(user.id)
         return await ctx.approve(
             f"Allowing **{user}** to use **{self.bot.user}** again"
         )
@@ -1321,6 +1321,5 @@ class Utility(Extended, Cog):
                 await page.emulate_media(color_scheme="dark")
                 await page.goto(url, wait_until="load")
                 screenshot = await page.screenshot(full_page=full_page)
-                await page.close()
 
         return await ctx.send(file=File(BytesIO(screenshot), filename="screenshot.png"))
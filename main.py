@@ -1,13 +1,17 @@
 import secrets
+from asyncio import gather
+from collections import OrderedDict
 from contextlib import suppress
 from datetime import datetime, timezone
-from logging import DEBUG, getLogger
-from pathlib import Path
+from logging import DEBUG, INFO, getLogger
+from os import scandir
+from os.path import isfile, join
 
-from time import time
+from time import monotonic, perf_counter
+from uuid import uuid4
 from pomice import NodePool
 
-from typing import Any, Collection, Dict, List, Optional, cast
+from typing import Any, Collection, Dict, FrozenSet, List, Optional, Set, Tuple
 
 import jishaku
 from aiohttp import ClientSession, TCPConnector
@@ -29,8 +33,11 @@ from discord import (
     MessageType,
     NotFound,
     PartialMessageable,
+    Permissions,
+    Role,
     StageChannel,
     TextChannel,
+    Thread,
     User,
     VoiceState,
     Activity,
@@ -45,6 +52,7 @@ from discord.ext.commands import (
     BucketType,
     ChannelNotFound,
     CheckFailure,
+    Cog,
     CommandError,
     CommandInvokeError,
     CommandNotFound,
@@ -68,8 +76,9 @@ from discord.ext.commands import (
     MinimalHelpCommand,
     when_mentioned_or,
 )
+from discord.abc import GuildChannel
+from discord.ext.commands.view import StringView
 from discord.message import Message
-from discord.utils import utcnow
 from humanfriendly import format_timespan
 
 from colorama import Fore, Style
@@ -79,12 +88,59 @@ from tools import fmtseconds
 from tools.browser import BrowserHandler
 from tools.client import Context, Redis, database, init_logging
 from tools.client.database import Database, Settings
+from tools.client.context import ReskinConfig
+from tools.conversion import close_session
 from tools.formatter import human_join, plural
 from tools.parser.TagScript.exceptions import EmbedParseError, TagScriptError
 from textwrap import shorten
 from tools.help import GreedHelp
 log = getLogger("greedbot/bot")
-cache.setup("mem://")
+PERMISSIONS_TTL = 30
+MAX_TRACEBACKS = 500
+MISSING_PERMISSIONS: Dict[FrozenSet[str], str] = {}
+
+# The color codes are baked into the format strings once at import,
+# the arguments are only interpolated when a record is actually emitted.
+READY_FORMAT = (
+    f"Connected as {Fore.LIGHTCYAN_EX}{Style.BRIGHT}%s{Fore.RESET}"
+    f" ({Fore.LIGHTRED_EX}%s{Fore.RESET})."
+)
+SHARD_FORMAT = f"Shard ID {Fore.LIGHTGREEN_EX}%s{Fore.RESET} has %s{Fore.RESET}."
+SHARD_SPAWNED = f"{Fore.LIGHTGREEN_EX}spawned"
+SHARD_RESUMED = f"{Fore.LIGHTYELLOW_EX}resumed"
+COMMAND_FORMAT = f" {Fore.RESET}".join(
+    [
+        f"{Fore.LIGHTMAGENTA_EX}%s",
+        f"ran {Fore.LIGHTCYAN_EX}{Style.BRIGHT}%s{Style.NORMAL}",
+        f"@ {Fore.LIGHTYELLOW_EX}%s",
+        f"/ {Fore.LIGHTBLUE_EX}%s",
+        f"{Fore.LIGHTWHITE_EX}{Style.DIM}%s{Fore.RESET}{Style.NORMAL}.",
+    ]
+)
+cache.setup("mem://?size=10000&check_interval=30")
+
+INTENTS = Intents(
+    guilds=True,
+    members=True,
+    messages=True,
+    reactions=True,
+    presences=True,
+    moderation=True,
+    voice_states=True,
+    message_content=True,
+    emojis_and_stickers=True,
+)
+ALLOWED_MENTIONS = AllowedMentions(
+    replied_user=False,
+    everyone=False,
+    roles=False,
+    users=True,
+)
+ACTIVITY = Activity(
+    type=ActivityType.custom,
+    name=" ",
+    state="🔗 discord.gg/greedbot",
+)
 
 jishaku.Flags.HIDE = True
 jishaku.Flags.RETAIN = True
@@ -95,20 +151,8 @@ jishaku.Flags.NO_DM_TRACEBACK = True
 async def get_prefix(bot: "greedbot", message: Message) -> List[str]:
     prefix = [config.CLIENT.PREFIX]
     if message.guild:
-        prefix = (
-            cast(
-                Optional[List[str]],
-                await bot.db.fetchval(
-                    """
-                    SELECT prefixes
-                    FROM settings
-                    WHERE guild_id = $1
-                    """,
-                    message.guild.id,
-                ),
-            )
-            or prefix
-        )
+        settings = await Settings.fetch(bot, message.guild)
+        prefix = settings.prefixes or prefix
 
     return when_mentioned_or(*prefix)(bot, message)
 
@@ -116,7 +160,10 @@ async def get_prefix(bot: "greedbot", message: Message) -> List[str]:
 class greedbot(Bot):
     session: ClientSession
     uptime: datetime
-    traceback: Dict[str, Exception]
+    traceback: OrderedDict[str, Exception]
+    permissions_cache: Dict[int, Tuple[float, int]]
+    blacklist: Set[int]
+    webhookless_channels: Set[int]
     global_cooldown: CooldownMapping
     owner_ids: Collection[int]
     database: Database
@@ -126,39 +173,23 @@ class greedbot(Bot):
     version: str = "v2.0"
     user_agent: str = f"greedbot (DISCORD BOT/{version})"
     browser: BrowserHandler
+    help_categories: Optional[Dict[str, Cog]] = None
 
     def __init__(self, *args, **kwargs):
         super().__init__(
             *args,
             **kwargs,
-            intents=Intents(
-                guilds=True,
-                members=True,
-                messages=True,
-                reactions=True,
-                presences=True,
-                moderation=True,
-                voice_states=True,
-                message_content=True,
-                emojis_and_stickers=True,
-            ),
-            allowed_mentions=AllowedMentions(
-                replied_user=False,
-                everyone=False,
-                roles=False,
-                users=True,
-            ),
+            intents=INTENTS,
+            allowed_mentions=ALLOWED_MENTIONS,
             command_prefix=get_prefix,
             help_command=GreedHelp(),
             case_insensitive=True,
             max_messages=1500,
-            activity=Activity(
-                type=ActivityType.custom,
-                name=" ",
-                state="🔗 discord.gg/greedbot",
-            ),
+            activity=ACTIVITY,
         )
-        self.traceback = {}
+        self.traceback = OrderedDict()
+        self.permissions_cache = {}
+        self.webhookless_channels = set()
         self.global_cooldown = CooldownMapping.from_cooldown(2, 3, BucketType.user)
         self.add_check(self.check_global_cooldown)
 
@@ -176,6 +207,35 @@ class greedbot(Bot):
     async def get_or_fetch_user(self, user_id: int) -> User:
         return self.get_user(user_id) or await self.fetch_user(user_id)
 
+    def me_permissions(self, channel: GuildChannel | Thread) -> Permissions:
+        """
+        Resolve the bot's permissions in a channel.
+        The result is reused for a short period of time.
+        """
+
+        # Threads inherit their parent's overwrites, which a channel
+        # update can't invalidate through the thread's own id.
+        if isinstance(channel, Thread):
+            return channel.permissions_for(channel.guild.me)
+
+        now = monotonic()
+        entry = self.permissions_cache.get(channel.id)
+        if entry and now - entry[0] < PERMISSIONS_TTL:
+            return Permissions(entry[1])
+
+        permissions = channel.permissions_for(channel.guild.me)
+        self.permissions_cache[channel.id] = (now, permissions.value)
+        return permissions
+
+    async def add_cog(self, cog: Cog, /, **kwargs) -> None:
+        await super().add_cog(cog, **kwargs)
+        self.help_categories = None
+
+    async def remove_cog(self, name: str, /, **kwargs) -> Optional[Cog]:
+        cog = await super().remove_cog(name, **kwargs)
+        self.help_categories = None
+        return cog
+
     def run(self) -> None:
         log.info("Starting the bot...")
 
@@ -189,30 +249,25 @@ class greedbot(Bot):
         await self.browser.cleanup()
         await super().close()
         await self.session.close()
+        await close_session()
 
     async def on_ready(self) -> None:
         if hasattr(self, "uptime"):
             return
 
-        log.info(
-            f"Connected as {Fore.LIGHTCYAN_EX}{Style.BRIGHT}{self.user}{Fore.RESET} ({Fore.LIGHTRED_EX}{self.user.id}{Fore.RESET})."
-        )
+        log.info(READY_FORMAT, self.user, self.user.id)
         self.uptime = datetime.now(timezone.utc)
-        self.browser = BrowserHandler()
-        await self.browser.init()
-        await self.wait_until_ready()
-        await self.load_extensions()
-        await self.connect_nodes()
+        await gather(
+            self.browser.init(),
+            self.load_extensions(),
+            self.connect_nodes(),
+        )
 
     async def on_shard_ready(self, shard_id: int) -> None:
-        log.info(
-            f"Shard ID {Fore.LIGHTGREEN_EX}{shard_id}{Fore.RESET} has {Fore.LIGHTGREEN_EX}spawned{Fore.RESET}."
-        )
+        log.info(SHARD_FORMAT, shard_id, SHARD_SPAWNED)
 
     async def on_shard_resumed(self, shard_id: int) -> None:
-        log.info(
-            f"Shard ID {Fore.LIGHTGREEN_EX}{shard_id}{Fore.RESET} has {Fore.LIGHTYELLOW_EX}resumed{Fore.RESET}."
-        )
+        log.info(SHARD_FORMAT, shard_id, SHARD_RESUMED)
 
     async def setup_hook(self) -> None:
         self.session = ClientSession(
@@ -226,43 +281,64 @@ class greedbot(Bot):
         except Exception as e:
             log.error(f"Failed to connect to database: {e}")
             raise
+        self.blacklist = {
+            record["user_id"]
+            for record in await self.database.fetch(
+                """
+                SELECT user_id
+                FROM blacklist
+                """
+            )
+        }
         self.redis = await Redis.from_url()
+        await ReskinConfig.drop_legacy_keys(self)
         self.browser = BrowserHandler()
         await self.browser.init()
 
     async def connect_nodes(self) -> None:
-        for _ in range(config.LAVALINK.NODE_COUNT):
-            await NodePool().create_node(
-                bot=self,  # type: ignore
-                host=config.LAVALINK.HOST,
-                port=config.LAVALINK.PORT,
-                password=config.LAVALINK.PASSWORD,
-                identifier=f"greedbot-{_}{time()}",
-                spotify_client_id=config.Authorization.SPOTIFY.CLIENT_ID,
-                spotify_client_secret=config.Authorization.SPOTIFY.CLIENT_SECRET,
-            )
+        results = await gather(
+            *(
+                NodePool().create_node(
+                    bot=self,  # type: ignore
+                    host=config.LAVALINK.HOST,
+                    port=config.LAVALINK.PORT,
+                    password=config.LAVALINK.PASSWORD,
+                    identifier=f"greedbot-{index}-{uuid4().hex[:8]}",
+                    spotify_client_id=config.Authorization.SPOTIFY.CLIENT_ID,
+                    spotify_client_secret=config.Authorization.SPOTIFY.CLIENT_SECRET,
+                )
+                for index in range(config.LAVALINK.NODE_COUNT)
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                log.exception("Failed to connect a Lavalink node.", exc_info=result)
 
     async def load_extensions(self) -> None:
         await self.load_extension("jishaku")
 
-        for feature in Path("cogs").iterdir():
-            if not feature.is_dir():
-                continue
+        with scandir("cogs") as entries:
+            features = [
+                entry.name
+                for entry in entries
+                if entry.is_dir() and isfile(join(entry.path, "__init__.py"))
+            ]
 
-            elif not (feature / "__init__.py").is_file():
-                continue
-
-            try:
-                await self.load_extension(".".join(feature.parts))
-            except Exception as exc:
-                log.exception(
-                    "Failed to load extension %s.", feature.name, exc_info=exc
-                )
+        results = await gather(
+            *(self.load_extension(f"cogs.{feature}") for feature in features),
+            return_exceptions=True,
+        )
+        for feature, result in zip(features, results):
+            if isinstance(result, Exception):
+                log.exception("Failed to load extension %s.", feature, exc_info=result)
 
     async def log_traceback(self, ctx: Context, exc: Exception) -> Message:
         """
         Store an Exception in memory.
         This is used for future reference.
+
+        Only the most recent exceptions are kept.
         """
 
         log.exception(
@@ -271,8 +347,10 @@ class greedbot(Bot):
             exc_info=exc,
         )
 
-        key = secrets.token_urlsafe(54)
+        key = secrets.token_urlsafe(12)
         self.traceback[key] = exc
+        while len(self.traceback) > MAX_TRACEBACKS:
+            self.traceback.popitem(last=False)
 
         return await ctx.warn(
             f"Command `{ctx.command.qualified_name}` raised an exception. Please try again later.",
@@ -280,11 +358,8 @@ class greedbot(Bot):
         )
 
     async def on_command_error(self, ctx: Context, exc: CommandError) -> Any:
-        channel = ctx.channel
-        if not (
-            channel.permissions_for(channel.guild.me).send_messages
-            and channel.permissions_for(channel.guild.me).embed_links
-        ):
+        permissions = self.me_permissions(ctx.channel)
+        if not (permissions.send_messages and permissions.embed_links):
             return
 
         if isinstance(
@@ -354,7 +429,7 @@ class greedbot(Bot):
 
             if isinstance(original, HTTPException):
                 if original.code == 50013:
-                    if ctx.channel.permissions_for(ctx.guild.me).embed_links:
+                    if self.me_permissions(ctx.channel).embed_links:
                         return await ctx.warn(
                             "I don't have the required **permissions** to do that!"
                         )
@@ -452,10 +527,14 @@ class greedbot(Bot):
             return await ctx.warn(f"The input must be {label}!")
 
         elif isinstance(exc, MissingPermissions):
-            permissions = human_join(
-                [f"`{permission}`" for permission in exc.missing_permissions],
-                final="and",
-            )
+            key = frozenset(exc.missing_permissions)
+            permissions = MISSING_PERMISSIONS.get(key)
+            if permissions is None:
+                permissions = MISSING_PERMISSIONS[key] = human_join(
+                    [f"`{permission}`" for permission in exc.missing_permissions],
+                    final="and",
+                )
+
             _plural = "s" if len(exc.missing_permissions) > 1 else ""
 
             return await ctx.warn(
@@ -489,20 +568,16 @@ class greedbot(Bot):
             return await ctx.send_help(ctx.command)
 
     async def on_command_completion(self, ctx: Context) -> None:
-        duration = (utcnow() - ctx.message.created_at).total_seconds()
-        guild = shorten(ctx.guild.name, width=25, placeholder="..")
-
-        log.info(
-            f" {Fore.RESET}".join(
-                [
-                    f"{Fore.LIGHTMAGENTA_EX}{ctx.author}",
-                    f"ran {Fore.LIGHTCYAN_EX}{Style.BRIGHT}{ctx.command.qualified_name}{Style.NORMAL}",
-                    f"@ {Fore.LIGHTYELLOW_EX}{guild}",
-                    f"/ {Fore.LIGHTBLUE_EX}{ctx.channel}",
-                    f"{Fore.LIGHTWHITE_EX}{Style.DIM}{fmtseconds(duration)}{Fore.RESET}{Style.NORMAL}.",
-                ]
+        if log.isEnabledFor(INFO):
+            duration = perf_counter() - ctx.started_at
+            log.info(
+                COMMAND_FORMAT,
+                ctx.author,
+                ctx.command.qualified_name,
+                shorten(ctx.guild.name, width=25, placeholder=".."),
+                ctx.channel,
+                fmtseconds(duration),
             )
-        )
 
         await self.db.execute(
             """
@@ -527,6 +602,7 @@ class greedbot(Bot):
         cls=Context,
     ) -> Context:
         context = await super().get_context(origin, cls=cls)
+        context.started_at = perf_counter()
         context.settings = await Settings.fetch(self, context.guild)
 
         return context
@@ -547,28 +623,28 @@ class greedbot(Bot):
         if not message.guild or message.author.bot:
             return
 
-        channel = message.channel
+        permissions = self.me_permissions(message.channel)
         if not (
-            channel.permissions_for(message.guild.me).send_messages
-            and channel.permissions_for(message.guild.me).embed_links
-            and channel.permissions_for(message.guild.me).attach_files
+            permissions.send_messages
+            and permissions.embed_links
+            and permissions.attach_files
         ):
             return
 
-        blacklisted = cast(
-            bool,
-            await self.db.fetchval(
-                """
-                SELECT EXISTS(
-                    SELECT 1
-                    FROM blacklist
-                    WHERE user_id = $1
-                )
-                """,
-                message.author.id,
-            ),
-        )
-        if blacklisted:
+        if message.author.id in self.blacklist:
+            return
+
+        prefixes = await self.get_prefix(message)
+        if not message.content.startswith(tuple(prefixes)):
+            # Nothing can be invoked, so skip the command parsing entirely.
+            ctx = Context(
+                prefix=None,
+                view=StringView(message.content),
+                bot=self,
+                message=message,
+            )
+            ctx.settings = await Settings.fetch(self, message.guild)
+            self.dispatch("message_without_command", ctx)
             return
 
         ctx = await self.get_context(message)
@@ -621,7 +697,24 @@ class greedbot(Bot):
         if isinstance(user, Member):
             self.dispatch("member_activity", channel, user)
 
+    async def on_guild_role_update(self, before: Role, after: Role) -> None:
+        if before.permissions != after.permissions:
+            self.permissions_cache.clear()
+
+    async def on_guild_channel_update(
+        self,
+        before: GuildChannel,
+        after: GuildChannel,
+    ) -> None:
+        self.permissions_cache.pop(after.id, None)
+        # Channels synced to a category resolve through its overwrites.
+        for channel in getattr(after, "channels", ()):
+            self.permissions_cache.pop(channel.id, None)
+
     async def on_member_update(self, before: Member, after: Member) -> None:
+        if after.id == self.user.id and before.roles != after.roles:
+            self.permissions_cache.clear()
+
         if after.guild.system_channel_flags.premium_subscriptions:
             return
 
@@ -666,20 +759,7 @@ class greedbot(Bot):
         self.dispatch(event, entry)
 
     async def on_guild_join(self, guild: Guild) -> None:
-        blacklisted = cast(
-            bool,
-            await self.db.fetchval(
-                """
-            SELECT EXISTS(
-                SELECT 1
-                FROM blacklist
-                WHERE user_id = $1
-            )
-                """,
-                guild.owner_id,
-            ),
-        )
-        if blacklisted:
+        if guild.owner_id in self.blacklist:
             with suppress(HTTPException):
                 await guild.leave()
 
@@ -709,13 +789,17 @@ class greedbot(Bot):
         #     return
 
         user: Optional[Member | User] = None
-        with suppress(HTTPException):
-            async for entry in guild.audit_logs(limit=5):
-                if entry.action != AuditLogAction.bot_add or entry.target != self.user:
-                    continue
+        if guild.me and guild.me.guild_permissions.view_audit_log:
+            with suppress(HTTPException):
+                async for entry in guild.audit_logs(
+                    limit=3,
+                    action=AuditLogAction.bot_add,
+                ):
+                    if entry.target != self.user:
+                        continue
 
-                user = entry.user
-                break
+                    user = entry.user
+                    break
 
         response: List[str] = []
         if guild.vanity_url:
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import sys
 import unicodedata
 from abc import ABC
 from contextlib import asynccontextmanager, contextmanager, suppress
+from functools import lru_cache
 from io import BytesIO
 from logging import Logger, getLogger
 from os import environ
@@ -12,10 +14,10 @@ from time import time
 from typing import TYPE_CHECKING, AsyncGenerator, Generator, List, Optional, Tuple
 from urllib.parse import urlparse
 
+import numpy as np
+import pyvips
 from anyio import Path as AsyncPath
-from cairosvg import svg2png
 from colorama import Fore, Style
-from colorthief import ColorThief
 from cryptography.fernet import Fernet
 from discord import (
     ButtonStyle,
@@ -28,12 +30,14 @@ from discord import (
     Message,
     PartialEmoji,
     PartialMessage,
+    Permissions,
     Role,
 )
 from discord.ext import commands
 from discord.ui import Button as OriginalButton
 from discord.ui import View as OriginalView
 from jishaku.functools import executor_function
+from PIL import Image as PILImage
 from tornado.escape import url_unescape
 from wand.image import Image
 from datetime import timedelta
@@ -48,8 +52,12 @@ if TYPE_CHECKING:
 
 TMP_ROOT = AsyncPath("/tmp")
 CACHE_ROOT = TMP_ROOT / "greedbot"
+CACHE_ROOT_CREATED = False
 
-fernet = Fernet(FERNET_KEY)
+
+@lru_cache(maxsize=None)
+def fernet() -> Fernet:
+    return Fernet(FERNET_KEY)
 
 
 class CompositeMetaClass(type(commands.Cog), type(ABC)):
@@ -81,23 +89,35 @@ async def quietly_delete(message: Message | PartialMessage) -> None:
     if not message.guild:
         return
 
-    if message.channel.permissions_for(message.guild.me).manage_messages:
+    me = message.guild.me
+    # The guild-wide bit skips resolving the channel's overwrites,
+    # but a channel overwrite can still grant it on its own.
+    if (
+        me.guild_permissions.manage_messages
+        or message.channel.permissions_for(me).manage_messages
+    ):
         with suppress(HTTPException):
             await message.delete()
 
 
+@lru_cache(maxsize=4096)
 def url_to_mime(url: str) -> tuple[Optional[str], str]:
     suffix = Path(urlparse(url_unescape(url)).path).suffix
     return (mimes.get(suffix, None), suffix)
 
 
+@lru_cache(maxsize=4096)
 def get_filename(url: str) -> str:
     return AsyncPath(urlparse(url_unescape(url)).path).name
 
 
 @asynccontextmanager
 async def temp_file(extension: str) -> AsyncGenerator[AsyncPath, None]:
-    await CACHE_ROOT.mkdir(parents=True, exist_ok=True)
+    global CACHE_ROOT_CREATED
+    if not CACHE_ROOT_CREATED:
+        await CACHE_ROOT.mkdir(parents=True, exist_ok=True)
+        CACHE_ROOT_CREATED = True
+
     tmp = CACHE_ROOT / f"{token_hex(8)}.{extension}"
 
     try:
@@ -106,27 +126,26 @@ async def temp_file(extension: str) -> AsyncGenerator[AsyncPath, None]:
         await tmp.unlink(missing_ok=True)
 
 
-def unicode_emoji(emoji: str) -> tuple[str, str]:
-    characters: list[str] = []
-    name: list[str] = []
-    for character in emoji:
-        characters.append(hex(ord(character))[2:])
-        try:
-            name.append(unicodedata.name(character))
-        except ValueError:
-            ...
-
-    if len(characters) == 2 and "fe0f" in characters:
-        characters.remove("fe0f")
-    if "20e3" in characters:
-        characters.remove("fe0f")
+@lru_cache(maxsize=2048)
+def twemoji_url(emoji: str) -> str:
+    characters = tuple(format(ord(character), "x") for character in emoji)
+    if len(characters) == 2 and characters[1] == "fe0f":
+        characters = characters[:1]
+    elif "20e3" in characters:
+        characters = tuple(
+            character for character in characters if character != "fe0f"
+        )
 
     return (
-        (
-            "https://cdn.jsdelivr.net/gh/jdecked/"
-            "twemoji@latest/assets/svg/" + "-".join(characters) + ".svg"
-        ),
-        "_".join(name),
+        "https://cdn.jsdelivr.net/gh/jdecked/"
+        "twemoji@latest/assets/svg/" + "-".join(characters) + ".svg"
+    )
+
+
+@lru_cache(maxsize=2048)
+def emoji_name(emoji: str) -> str:
+    return "_".join(
+        name for character in emoji if (name := unicodedata.name(character, None))
     )
 
 
@@ -141,37 +160,48 @@ def dominant_color(buffer: BytesIO | bytes) -> Color:
     if isinstance(buffer, bytes):
         buffer = BytesIO(buffer)
 
-    thief = ColorThief(buffer)
-    color = thief.get_color()
-    return Color.from_rgb(*color)
+    with PILImage.open(buffer) as image:
+        image = image.convert("RGBA")
+        image.thumbnail((64, 64), PILImage.BILINEAR)
+        pixels = np.asarray(image, dtype=np.uint32).reshape(-1, 4)
+
+    # Like ColorThief, mostly transparent and near white pixels don't count.
+    rgb = pixels[:, :3]
+    rgb = rgb[(pixels[:, 3] >= 125) & ~(rgb > 250).all(axis=1)]
+    if not len(rgb):
+        return Color.dark_embed()
+
+    # Similar shades share a 5-bit bin, the winner is the mean of its pixels.
+    bins = rgb >> 3
+    packed = (bins[:, 0] << 10) | (bins[:, 1] << 5) | bins[:, 2]
+    winner = rgb[packed == np.bincount(packed).argmax()]
+    red, green, blue = (int(value) for value in winner.mean(axis=0).round())
+    return Color.from_rgb(red, green, blue)
 
 
 @executor_function
 def enlarge_emoji(buffer: bytes, format: str) -> Tuple[Optional[bytes], str]:
     if format == "svg":
-        return (
-            svg2png(
-                buffer,
-                parent_height=1024,
-                parent_width=1024,
-            ),
-            "png",
-        )
+        image = pyvips.Image.thumbnail_buffer(buffer, 1024, height=1024)
+        return image.write_to_buffer(".png"), "png"
+
+    # Only the animated loaders accept n, the others reject it as an argument.
+    animated = format in ("gif", "webp")
+    image = (
+        pyvips.Image.new_from_buffer(buffer, "", n=-1)
+        if animated
+        else pyvips.Image.new_from_buffer(buffer, "")
+    )
+    factor = max(300 // image.width, 1)
 
-    with Image(blob=buffer) as image:
-        factor = 300 // image.width
-
-        image.interlace_scheme = format
-        image.quantize(250)
-        image.coalesce()
-        image.optimize_layers()
-        image.resize(
-            width=image.width * factor,
-            height=image.height * factor,
-            filter="lanczos2sharp",
-        )
+    if not animated or not image.get_typeof("page-height"):
+        image = image.resize(factor, kernel="lanczos2")
+        return image.write_to_buffer(f".{format}"), format
 
-        return image.make_blob(), format
+    page_height = image.get("page-height")
+    image = image.resize(factor, kernel="lanczos2").copy()
+    image.set("page-height", page_height * factor)
+    return image.write_to_buffer(f".{format}"), format
 
 
 @contextmanager
@@ -184,7 +214,9 @@ def capture_time(
         log = getLogger("greedbot/utils")
 
     if not msg:
-        msg = log.findCaller()[2]
+        # Skip this generator and contextlib's __enter__.
+        code = sys._getframe(2).f_code
+        msg = getattr(code, "co_qualname", code.co_name)
 
     try:
         yield
@@ -195,24 +227,22 @@ def capture_time(
         )
 
 
+DANGEROUS_PERMISSIONS = Permissions(
+    administrator=True,
+    kick_members=True,
+    ban_members=True,
+    manage_guild=True,
+    manage_roles=True,
+    manage_channels=True,
+    manage_emojis=True,
+    manage_webhooks=True,
+    manage_nicknames=True,
+    mention_everyone=True,
+).value
+
+
 def is_dangerous(role: Role) -> bool:
-    return any(
-        value
-        and permission
-        in (
-            "administrator",
-            "kick_members",
-            "ban_members",
-            "manage_guild",
-            "manage_roles",
-            "manage_channels",
-            "manage_emojis",
-            "manage_webhooks",
-            "manage_nicknames",
-            "mention_everyone",
-        )
-        for permission, value in role.permissions
-    )
+    return bool(role.permissions.value & DANGEROUS_PERMISSIONS)
 
 
 async def strip_roles(
@@ -229,16 +259,14 @@ async def strip_roles(
     if member.top_role >= bot.top_role and bot.id != member.guild.owner_id:
         return False
 
-    roles: List[Role] = []
-    for role in member.roles[1:]:
-        if not role.is_assignable():
-            continue
-
-        elif dangerous and not is_dangerous(role):
-            continue
-
-        roles.append(role)
+    if len(member.roles) == 1:
+        return False
 
+    roles: List[Role] = [
+        role
+        for role in member.roles[1:]
+        if role.is_assignable() and (not dangerous or is_dangerous(role))
+    ]
     if roles:
         with suppress(HTTPException):
             await member.remove_roles(*roles, reason=reason)
@@ -313,7 +341,8 @@ __all__ = (
     "url_to_mime",
     "get_filename",
     "temp_file",
-    "unicode_emoji",
+    "twemoji_url",
+    "emoji_name",
     "convert_image",
     "dominant_color",
     "capture_time",
@@ -1,39 +1,50 @@
-from contextlib import asynccontextmanager
-from http.cookiejar import MozillaCookieJar
+from asyncio import Queue, to_thread
+from contextlib import asynccontextmanager, suppress
+from http.cookiejar import Cookie, MozillaCookieJar
 from logging import getLogger
 from secrets import token_urlsafe
-from typing import AsyncGenerator, Literal, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
 from anyio import CapacityLimiter
 from playwright.async_api import (
     Browser,
     BrowserContext,
+    Error as PlaywrightError,
     Page,
     Playwright,
     async_playwright,
 )
-from pydantic import BaseConfig, BaseModel
 
 import config
 
 log = getLogger("greedbot/browser")
-jar = MozillaCookieJar()
-jar.load("cookies.txt")
 
 
-class CookieModel(BaseModel):
-    name: str
-    value: str
-    url: Optional[str]
-    domain: Optional[str]
-    path: Optional[str]
-    expires: int = -1
-    httpOnly: Optional[bool]
-    secure: Optional[bool]
-    sameSite: Optional[Literal["Lax", "None", "Strict"]]
+def cookie_payload(cookie: Cookie) -> Dict[str, Any]:
+    """
+    Reshape a jar cookie into the format Playwright expects.
+    """
 
-    class Config(BaseConfig):
-        orm_mode = True
+    return {
+        "name": cookie.name,
+        "value": cookie.value or "",
+        "domain": cookie.domain,
+        "path": cookie.path,
+        "expires": int(cookie.expires) if cookie.expires else -1,
+        "secure": bool(cookie.secure),
+        "httpOnly": cookie.has_nonstandard_attr("HttpOnly"),
+    }
+
+
+def read_cookies(path: str = "cookies.txt") -> List[Dict[str, Any]]:
+    """
+    Load the cookie jar from disk.
+    This blocks, so it should be run in a thread.
+    """
+
+    jar = MozillaCookieJar()
+    jar.load(path)
+    return [cookie_payload(cookie) for cookie in jar]
 
 
 class BrowserHandler:
@@ -41,11 +52,20 @@ class BrowserHandler:
     playwright: Optional[Playwright] = None
     browser: Optional[Browser] = None
     context: Optional[BrowserContext] = None
+    pages: Optional[Queue[Page]] = None
+    cookies: Optional[List[Dict[str, Any]]] = None
 
     def __init__(self) -> None:
         self.limiter = CapacityLimiter(4)
 
     async def cleanup(self) -> None:
+        # Drain the pool first, so a re-init doesn't keep the old context's pages.
+        if self.pages:
+            pages, self.pages = self.pages, None
+            while not pages.empty():
+                with suppress(PlaywrightError):
+                    await pages.get_nowait().close()
+
         if self.playwright:
             await self.playwright.stop()
 
@@ -54,6 +74,9 @@ class BrowserHandler:
 
     async def init(self) -> None:
         await self.cleanup()
+        if self.cookies is None:
+            self.cookies = await to_thread(read_cookies)
+
         self.playwright = await async_playwright().start()
         self.browser = await self.playwright.chromium.launch(
             proxy={
@@ -68,25 +91,40 @@ class BrowserHandler:
                 "(KHTML, like Gecko) Chrome/93.0.4577.63 Safari/537.36"
             ),
         )
-        await self.context.add_cookies(
-            [
-                cookie.dict(exclude_unset=True)
-                for _cookie in jar
-                if (cookie := CookieModel.from_orm(_cookie))
-            ]  # type: ignore
-        )
+        await self.context.add_cookies(self.cookies)  # type: ignore
+
+        # Keep one warm page per limiter slot to skip the page spin-up on borrow.
+        self.pages = Queue()
+        for _ in range(int(self.limiter.total_tokens)):
+            self.pages.put_nowait(await self.context.new_page())
 
     @asynccontextmanager
     async def borrow_page(self) -> AsyncGenerator[Page, None]:
-        if not self.context:
+        if not self.context or not self.pages:
             raise RuntimeError("Browser context is not initialized.")
 
         await self.limiter.acquire()
-        identifier, page = token_urlsafe(12), await self.context.new_page()
+        pages = self.pages
+        identifier, page = token_urlsafe(12), pages.get_nowait()
         log.debug("Borrowing page ID %s.", identifier)
         try:
+            if page.is_closed():
+                page = await self.context.new_page()
+
             yield page
         finally:
-            self.limiter.release()
-            await page.close()
-            log.debug("Released page ID %s.", identifier)
+            try:
+                # Borrowers can route, emulate or resize the page,
+                # so it's replaced instead of being reset to a blank page.
+                with suppress(PlaywrightError):
+                    await page.close()
+
+                # A re-init drained this pool, the new one is already full.
+                if pages is self.pages and self.context:
+                    page = await self.context.new_page()
+            finally:
+                if pages is self.pages:
+                    pages.put_nowait(page)
+
+                self.limiter.release()
+                log.debug("Released page ID %s.", identifier)
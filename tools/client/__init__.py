@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import re
+from typing import Optional, Pattern
+
 from discord.ext.commands import FlagConverter as OriginalFlagConverter
 from typing_extensions import Self
 
@@ -8,6 +11,8 @@ from .database import Database, Settings
 from .logging import init_logging
 from .redis import Redis
 
+DASHES = {ord("—"): "--"}
+
 
 class FlagConverter(
     OriginalFlagConverter,
@@ -19,8 +24,37 @@ class FlagConverter(
     def values(self):
         return self.get_flags().values()
 
+    @classmethod
+    def flag_pattern(cls) -> Optional[Pattern[str]]:
+        """
+        Compile a pattern matching every flag and its value.
+        The pattern is built once per class.
+        """
+
+        if "_flag_pattern" not in cls.__dict__:
+            names = sorted(
+                {
+                    name
+                    for flag in cls.get_flags().values()
+                    for name in (flag.name, *flag.aliases)
+                },
+                key=len,
+                reverse=True,
+            )
+            flag = rf"--(?:{'|'.join(map(re.escape, names))})(?=\s|\Z)"
+            cls._flag_pattern = (
+                re.compile(
+                    rf"{flag}.*?(?=\s+{flag}|\s*\Z)",
+                    re.IGNORECASE | re.DOTALL,
+                )
+                if names
+                else None
+            )
+
+        return cls._flag_pattern
+
     async def convert(self, ctx: Context, argument: str):
-        argument = argument.replace("—", "--")
+        argument = argument.translate(DASHES)
         return await super().convert(ctx, argument)
 
     async def find(
@@ -35,16 +69,11 @@ class FlagConverter(
         result with the remaining string.
         """
 
-        argument = argument.replace("—", "--")
+        argument = argument.translate(DASHES)
         flags = await self.convert(ctx, argument)
 
-        if remove:
-            for key, values in flags.parse_flags(argument).items():
-                aliases = getattr(self.get_flags().get(key), "aliases", [])
-                for _key in aliases:
-                    argument = argument.replace(f"--{_key} {' '.join(values)}", "")
-
-                argument = argument.replace(f"--{key} {' '.join(values)}", "")
+        if remove and (pattern := self.flag_pattern()):
+            argument = pattern.sub("", argument)
 
         return argument.strip(), flags
 
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from contextlib import suppress
 from datetime import datetime
-from io import BytesIO
+from io import SEEK_END, BytesIO
+from queue import Empty, Full, LifoQueue
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -17,6 +19,7 @@ from aiomisc import PeriodicCallback
 import config
 import discord
 from aiohttp import ClientSession
+from cachetools import TTLCache
 from cashews import cache
 from discord import (
     ButtonStyle,
@@ -37,10 +40,10 @@ from discord.ext.commands import Context as OriginalContext
 from discord.ext.commands import UserInputError
 from discord.types.embed import EmbedType
 from discord.ui import button
-from discord.utils import MISSING, cached_property, get
+from discord.utils import MISSING, cached_property
 from pydantic import BaseConfig, BaseModel
 from typing_extensions import Self
-from xxhash import xxh32_hexdigest
+from xxhash import xxh3_64_intdigest, xxh32_hexdigest
 
 
 from tools import View, quietly_delete
@@ -53,6 +56,39 @@ if TYPE_CHECKING:
     from types import TracebackType
 
 BE = TypeVar("BE", bound=BaseException)
+RESKIN_CACHE: TTLCache[str, dict] = TTLCache(maxsize=10_000, ttl=30)
+BUFFER_POOL: LifoQueue[BytesIO] = LifoQueue(maxsize=32)
+MAX_POOLED_BUFFER = 1024 * 1024
+
+
+def acquire_buffer(data: bytes) -> BytesIO:
+    """
+    Take a buffer from the pool and fill it with data.
+    A new buffer is allocated when the pool is empty.
+    """
+
+    try:
+        buffer = BUFFER_POOL.get_nowait()
+    except Empty:
+        return BytesIO(data)
+
+    buffer.seek(0)
+    buffer.truncate()
+    buffer.write(data)
+    buffer.seek(0)
+    return buffer
+
+
+def release_buffer(buffer: BytesIO) -> None:
+    """
+    Return a buffer to the pool once it has been sent.
+    """
+
+    if buffer.seek(0, SEEK_END) > MAX_POOLED_BUFFER:
+        return
+
+    with suppress(Full):
+        BUFFER_POOL.put_nowait(buffer)
 
 
 class ReskinConfig(BaseModel):
@@ -62,7 +98,31 @@ class ReskinConfig(BaseModel):
 
     @classmethod
     def key(cls, member: Member) -> str:
-        return xxh32_hexdigest(f"reskin.config:{member.id}")
+        return f"r:{xxh3_64_intdigest(str(member.id)):016x}"
+
+    @classmethod
+    async def drop_legacy_keys(cls, bot: greedbot) -> None:
+        """
+        Delete the reskins cached under the old xxh32 keys.
+        They were stored without an expiry, so they'd never be removed otherwise.
+        """
+
+        if await bot.redis.exists("reskin:legacy_keys_dropped"):
+            return
+
+        keys = [
+            xxh32_hexdigest(f"reskin.config:{record['user_id']}")
+            for record in await bot.db.fetch(
+                """
+                SELECT user_id
+                FROM reskin.config
+                """
+            )
+        ]
+        for index in range(0, len(keys), 1000):
+            await bot.redis.delete(*keys[index : index + 1000])
+
+        await bot.redis.set("reskin:legacy_keys_dropped", 1)
 
     @classmethod
     async def revalidate(cls, bot: greedbot, member: Member) -> Optional[Self]:
@@ -72,6 +132,7 @@ class ReskinConfig(BaseModel):
         """
 
         key = cls.key(member)
+        RESKIN_CACHE.pop(key, None)
         await bot.redis.delete(key)
 
         record = await bot.db.fetchrow(
@@ -93,15 +154,20 @@ class ReskinConfig(BaseModel):
     async def fetch(cls, bot: greedbot, member: Member) -> Optional[Self]:
         """
         Fetch the reskin for a member.
-        This will cache the settings in redis.
+        This will cache the settings in memory and redis.
         """
 
         key = cls.key(member)
+        cached = RESKIN_CACHE.get(key)
+        if cached:
+            return cls(**cached, member=member)
+
         cached = cast(
             Optional[dict],
             await bot.redis.get(key),
         )
         if cached:
+            RESKIN_CACHE[key] = cached
             return cls(**cached, member=member)
 
         record = await bot.db.fetchrow(
@@ -116,7 +182,8 @@ class ReskinConfig(BaseModel):
             return
 
         settings = cls(**record, member=member)
-        await bot.redis.set(key, settings.dict(exclude={"member"}))
+        RESKIN_CACHE[key] = cached = settings.dict(exclude={"member"})
+        await bot.redis.set(key, cached)
         return settings
 
     class Config(BaseConfig):
@@ -180,7 +247,7 @@ class Loading:
 
     @property
     def key(self) -> str:
-        return xxh32_hexdigest(f"loader:{self.channel.id}")
+        return f"l:{xxh3_64_intdigest(str(self.channel.id)):016x}"
 
     async def locked(self) -> bool:
         if await self.redis.exists(self.key):
@@ -230,6 +297,7 @@ class Context(OriginalContext):
     channel: VoiceChannel | TextChannel | Thread
     command: Command[Any, ..., Any]
     settings: Settings
+    started_at: float
     response: Optional[Message] = None
 
     @property
@@ -290,12 +358,13 @@ class Context(OriginalContext):
             kwargs["content"] = args[0]
             args = ()
 
-        if kwargs.get("content") and len(str(kwargs["content"])) > 2000:
-            kwargs["file"] = File(
-                BytesIO(str(kwargs["content"]).encode("utf-8")),
-                filename="message.txt",
-            )
-            kwargs["content"] = None
+        buffer: Optional[BytesIO] = None
+        if content := kwargs.get("content"):
+            content = content if isinstance(content, str) else str(content)
+            if len(content) > 2000:
+                buffer = acquire_buffer(content.encode("utf-8"))
+                kwargs["file"] = File(buffer, filename="message.txt")
+                kwargs["content"] = None
 
         if file := kwargs.pop("file", None):
             kwargs["files"] = [file]
@@ -303,9 +372,22 @@ class Context(OriginalContext):
         if kwargs.get("view") is None:
             kwargs.pop("view", None)
 
+        try:
+            return await self._deliver(patch, reference, *args, **kwargs)
+        finally:
+            if buffer:
+                release_buffer(buffer)
+
+    async def _deliver(
+        self,
+        patch: Optional[Message],
+        reference: Optional[Message],
+        *args,
+        **kwargs,
+    ) -> Message:
         if self.settings.reskin:
             reskin = await ReskinConfig.fetch(self.bot, self.author)
-            if reskin:
+            if reskin and self.channel.id not in self.bot.webhookless_channels:
                 webhook = await self.reskin_webhook()
                 if webhook:
                     delete_after: Optional[int] = kwargs.pop("delete_after", None)
@@ -334,6 +416,10 @@ class Context(OriginalContext):
                         return self.response
 
                     except NotFound:
+                        await self.bot.redis.hdel(
+                            f"reskin:webhooks:{self.guild.id}",
+                            str(webhook.id),
+                        )
                         await self.bot.db.execute(
                             """
                             DELETE FROM reskin.webhook
@@ -364,6 +450,19 @@ class Context(OriginalContext):
     async def reply(self, *args, **kwargs) -> Message:
         return await self.send(*args, **kwargs)
 
+    async def _respond(
+        self,
+        prefix: str,
+        args: Sequence[str],
+        color: int,
+        **kwargs,
+    ) -> Message:
+        embed = Embed(
+            description=prefix + "\n".join(map(str, args)),
+            color=kwargs.pop("color", color),
+        )
+        return await self.send(embed=embed, **kwargs)
+
     async def neutral(
         self,
         *args: str,
@@ -373,14 +472,7 @@ class Context(OriginalContext):
         Send a neutral embed.
         """
 
-        embed = Embed(
-            description="\n".join(
-                ("" if len(args) == 1 or index == len(args) - 1 else "") + str(arg)
-                for index, arg in enumerate(args)
-            ),
-            color=kwargs.pop("color", config.Colors.greed),
-        )
-        return await self.send(embed=embed, **kwargs)
+        return await self._respond("", args, config.Colors.greed, **kwargs)
 
     async def approve(
         self,
@@ -391,14 +483,7 @@ class Context(OriginalContext):
         Send a success embed.
         """
 
-        embed = Embed(
-            description="✅ "+"\n".join(
-                ("" if len(args) == 1 or index == len(args) - 1 else "") + str(arg)
-                for index, arg in enumerate(args)
-            ),
-            color=kwargs.pop("color", config.Colors.approve),
-        )
-        return await self.send(embed=embed, **kwargs)
+        return await self._respond("✅ ", args, config.Colors.approve, **kwargs)
 
     async def warn(
         self,
@@ -409,14 +494,7 @@ class Context(OriginalContext):
         Send an error embed.
         """
 
-        embed = Embed(
-            description="⚠️ "+"\n".join(
-                ("" if len(args) == 1 or index == len(args) - 1 else "") + str(arg)
-                for index, arg in enumerate(args)
-            ),
-            color=kwargs.pop("color", config.Colors.warning),
-        )
-        return await self.send(embed=embed, **kwargs)
+        return await self._respond("⚠️ ", args, config.Colors.warning, **kwargs)
 
     async def prompt(
         self,
@@ -430,13 +508,11 @@ class Context(OriginalContext):
         Raises UserInputError if the user denies the prompt.
         """
 
-        key = xxh32_hexdigest(f"prompt:{self.author.id}:{self.command.qualified_name}")
+        resource = f"{self.author.id}:{self.command.qualified_name}"
+        key = f"p:{xxh3_64_intdigest(resource):016x}"
         async with self.bot.redis.get_lock(key):
             embed = Embed(
-                description="\n".join(
-                    ("" if len(args) == 1 or index == len(args) - 1 else "") + str(arg)
-                    for index, arg in enumerate(args)
-                ),
+                description="\n".join(map(str, args)),
                 color=config.Colors.greed,
             )
             view = Confirmation(self, timeout=timeout)
@@ -474,12 +550,35 @@ class Context(OriginalContext):
             ),
         )
         if not webhook_id:
+            self.bot.webhookless_channels.add(self.channel.id)
             return
 
-        webhooks = await self.channel.webhooks()
-        webhook = get(webhooks, id=webhook_id)
-        if webhook:
-            return webhook
+        key = f"reskin:webhooks:{self.guild.id}"
+        token = await self.bot.redis.hget(key, str(webhook_id))
+        if not token:
+            # One request for the whole guild populates every channel at once,
+            # but it needs manage_webhooks guild-wide instead of in the channel.
+            webhooks = (
+                await self.guild.webhooks()
+                if self.guild.me.guild_permissions.manage_webhooks
+                else await self.channel.webhooks()
+            )
+            tokens = {
+                str(webhook.id): webhook.token
+                for webhook in webhooks
+                if webhook.token
+            }
+            if tokens:
+                await self.bot.redis.hset(key, mapping=tokens)
+                await self.bot.redis.expire(key, 7200)
+
+            token = tokens.get(str(webhook_id))
+
+        if token:
+            if isinstance(token, bytes):
+                token = token.decode("utf-8")
+
+            return discord.Webhook.partial(webhook_id, token, client=self.bot)
 
         cache.invalidate(self.reskin_webhook)  # type: ignore
         await self.bot.db.execute(
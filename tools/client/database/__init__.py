@@ -1,10 +1,10 @@
-from json import dumps, loads
 from logging import getLogger
 from typing import Any, List, Optional, Union
 
 from asyncpg import Connection, Pool
 from asyncpg import Record as DefaultRecord
 from asyncpg import create_pool
+from orjson import OPT_NON_STR_KEYS, dumps, loads
 
 import config
 
@@ -13,12 +13,16 @@ from .settings import Settings
 log = getLogger("greedbot/db")
 
 
-def ENCODER(self: Any) -> str:
-    return dumps(self)
+# JSONB's binary wire format is the JSON text prefixed with a version byte.
+JSONB_VERSION = b"\x01"
+
+
+def ENCODER(self: Any) -> bytes:
+    return JSONB_VERSION + dumps(self, option=OPT_NON_STR_KEYS)
 
 
 def DECODER(self: bytes) -> Any:
-    return loads(self)
+    return loads(self[1:])
 
 
 class Record(DefaultRecord):
@@ -69,6 +73,7 @@ async def init(connection: Connection):
         schema="pg_catalog",
         encoder=ENCODER,
         decoder=DECODER,
+        format="binary",
     )
 
     with open("tools/client/database/schema.sql", "r", encoding="UTF-8") as buffer:
@@ -1,10 +1,11 @@
+import atexit
 import logging.handlers
-import pathlib
 import sys
-from datetime import datetime
 from logging import LogRecord
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from os import name, system
+from queue import SimpleQueue
+from time import localtime, strftime, time
 from typing import Dict, List, Optional, Tuple, cast
 
 import rich
@@ -66,11 +67,15 @@ class greedbotTraceback(Traceback):
 
 
 class greedbotLogRender(LogRender):
+    # The time column has a resolution of one second,
+    # so records within the same second reuse the last display.
+    _last_second: int = -1
+
     def __call__(
         self,
         console: Console,
         renderables: List[Text],
-        log_time: Optional[datetime] = None,
+        log_time: Optional[float] = None,
         time_format: Optional[str] = None,
         level: str = "",
         path: Optional[str] = None,
@@ -80,21 +85,23 @@ class greedbotLogRender(LogRender):
     ):
         output = Text()
         if self.show_time:
-            log_time = log_time or console.get_datetime()
-            log_time_display = log_time.strftime(time_format or self.time_format)  # type: ignore
-            if log_time_display == self._last_time:
-                output.append(" " * (len(log_time_display) + 1))
+            second = int(log_time or time())
+            if second == self._last_second:
+                output.append(" " * (len(self._last_time) + 1))  # type: ignore
             else:
+                log_time_display = strftime(
+                    time_format or self.time_format, localtime(second)  # type: ignore
+                )
                 output.append(f"{log_time_display} ", style="log.time")
                 self._last_time = log_time_display  # type: ignore
+                self._last_second = second
         if self.show_level:
             output.append(level)
             output.append(" " * (8 - len(level)))
         if logger_name:
             logger_name = logger_name.removeprefix("discord.")
 
-            output.append(f"[{logger_name}] ", style="#BBAAEE")
-            output.append(" " * (14 - len(logger_name)))
+            output.append(f"{f'[{logger_name}]':<16} ", style="#BBAAEE")
 
         output.append(*renderables)  # type: ignore
         if self.show_path and path:
@@ -119,6 +126,9 @@ class greedbotRichHandler(RichHandler):
             show_path=self._log_render.show_path,
             level_width=self._log_render.level_width,
         )
+        # Resolved once, emit runs for every record.
+        self._print = self.console.print
+        self._render = self._log_render
 
     def get_level_text(self, record: LogRecord) -> Text:
         """Get the level name from the record.
@@ -135,11 +145,10 @@ class greedbotRichHandler(RichHandler):
 
     def emit(self, record: LogRecord) -> None:
         """Invoked by logging."""
-        path = pathlib.Path(record.pathname).name
+        path = record.filename
         level = cast(str, self.get_level_text(record))
         message = self.format(record)
         time_format = None if self.formatter is None else self.formatter.datefmt
-        log_time = datetime.fromtimestamp(record.created)
 
         traceback = None
         if (
@@ -165,36 +174,54 @@ class greedbotRichHandler(RichHandler):
             )
             message = record.getMessage()
 
-        use_markup = (
-            getattr(record, "markup") if hasattr(record, "markup") else self.markup
-        )
+        use_markup = record.__dict__.get("markup", self.markup)
         message_text = Text.from_markup(message) if use_markup else Text(message)
-        if self.highlighter:
-            message_text = self.highlighter(message_text)
-        if self.KEYWORDS:
-            message_text.highlight_words(self.KEYWORDS, "logging.keyword")
-
-        self.console.print(
-            self._log_render(
-                self.console,
-                [message_text],
-                log_time=log_time,
-                time_format=time_format,
-                level=level,
-                path=path,
-                line_no=record.lineno,
-                link_path=record.pathname if self.enable_link_path else None,
-                logger_name=record.name,
-            ),
-            soft_wrap=True,
-        )
-        if traceback:
-            self.console.print(traceback)
+        if highlighter := self.highlighter:
+            message_text = highlighter(message_text)
+        if keywords := self.KEYWORDS:
+            message_text.highlight_words(keywords, "logging.keyword")
+
+        # Entering the console buffers both prints into a single write.
+        with self.console:
+            self._print(
+                self._render(
+                    self.console,
+                    [message_text],
+                    log_time=record.created,
+                    time_format=time_format,
+                    level=level,
+                    path=path,
+                    line_no=record.lineno,
+                    link_path=record.pathname if self.enable_link_path else None,
+                    logger_name=record.name,
+                ),
+                soft_wrap=True,
+            )
+            if traceback:
+                self._print(traceback)
+
+
+class greedbotQueueHandler(QueueHandler):
+    """Hand records over to the listener thread, which renders them with Rich."""
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        # Only merge the arguments here, the exception info is left
+        # intact so the Rich handler can still render the traceback.
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 def init_logging(level: int) -> None:
     system("cls" if name == "nt" else "clear")
 
+    # None of these record attributes are rendered, so skip collecting them.
+    # https://docs.python.org/3/howto/logging.html#optimization
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     rich_console = rich.get_console()
     rich.reconfigure(tab_size=4)
     rich_console.push_theme(
@@ -231,8 +258,30 @@ def init_logging(level: int) -> None:
         ),
     )
 
+    stdout_handler.setFormatter(rich_formatter)
+    file_handler = RotatingFileHandler(
+        "greedbot.log",
+        encoding="utf-8",
+        mode="w",
+        maxBytes=32 * 1024 * 1024,
+        backupCount=3,
+    )
+    file_handler.addFilter(logging.Filter("discord.http"))
+
+    # Rendering and file writes happen on the listener thread,
+    # the event loop only pays for putting the record on the queue.
+    queue: SimpleQueue[LogRecord] = SimpleQueue()
+    listener = QueueListener(
+        queue,
+        stdout_handler,
+        file_handler,
+        respect_handler_level=True,
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
     setup_logging(
-        handler=stdout_handler,
+        handler=greedbotQueueHandler(queue),
         formatter=rich_formatter,
         level=logging.INFO,
         root=True,
@@ -247,12 +296,3 @@ def init_logging(level: int) -> None:
 
     # logging.getLogger("discord.http").setLevel(logging.DEBUG)
     logging.getLogger("asyncio").setLevel(logging.CRITICAL)
-    handler = RotatingFileHandler(
-        "greedbot.log",
-        encoding="utf-8",
-        mode="w",
-        maxBytes=32 * 1024 * 1024,
-        backupCount=3,
-    )
-    log = logging.getLogger("discord.http")
-    log.addHandler(handler)
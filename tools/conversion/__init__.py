@@ -4,7 +4,7 @@ import re
 from datetime import timedelta
 from typing import TYPE_CHECKING, Dict, List, Literal, Optional
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, TCPConnector
 from discord import Asset, Forbidden, HTTPException, Member, Message, NotFound, User
 from discord.ext.commands import (
     BadArgument,
@@ -27,17 +27,50 @@ if TYPE_CHECKING:
 MEDIA_URL_PATTERN = re.compile(
     r"(?:http\:|https\:)?\/\/.*\.(?P<mime>png|jpg|jpeg|webp|gif|mp4|mp3|mov|wav|ogg|zip)"
 )
-DURATION_PATTERN = r"\s?".join(
-    [
-        r"((?P<years>\d+?)\s?(years?|y))?",
-        r"((?P<months>\d+?)\s?(months?|mo))?",
-        r"((?P<weeks>\d+?)\s?(weeks?|w))?",
-        r"((?P<days>\d+?)\s?(days?|d))?",
-        r"((?P<hours>\d+?)\s?(hours?|hrs|hr?))?",
-        r"((?P<minutes>\d+?)\s?(minutes?|mins?|m(?!o)))?",
-        r"((?P<seconds>\d+?)\s?(seconds?|secs?|s))?",
-    ]
+DURATION_PATTERN = re.compile(
+    r"\s?".join(
+        [
+            r"((?P<years>\d+?)\s?(years?|y))?",
+            r"((?P<months>\d+?)\s?(months?|mo))?",
+            r"((?P<weeks>\d+?)\s?(weeks?|w))?",
+            r"((?P<days>\d+?)\s?(days?|d))?",
+            r"((?P<hours>\d+?)\s?(hours?|hrs|hr?))?",
+            r"((?P<minutes>\d+?)\s?(minutes?|mins?|m(?!o)))?",
+            r"((?P<seconds>\d+?)\s?(seconds?|secs?|s))?",
+        ]
+    ),
+    re.IGNORECASE,
 )
+MENTION_PATTERN = re.compile(r"<@!?\d+>$")
+ID_OR_MENTION_PATTERN = re.compile(r"\d+$|<@!?\d+>$")
+MAX_ATTACHMENT_SIZE = 50 * 1024 * 1024
+
+
+SESSION: Optional[ClientSession] = None
+
+
+def get_session() -> ClientSession:
+    """
+    Get the session used to download attachments.
+    It's created on first use so connections are kept alive between reads.
+    """
+
+    global SESSION
+    if SESSION is None or SESSION.closed:
+        SESSION = ClientSession(
+            connector=TCPConnector(
+                limit=64,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            ),
+        )
+
+    return SESSION
+
+
+async def close_session() -> None:
+    if SESSION and not SESSION.closed:
+        await SESSION.close()
 
 
 class Status(Converter[bool]):
@@ -45,14 +78,21 @@ class Status(Converter[bool]):
         return argument.lower() in {"enable", "yes", "on", "true"}
 
 
+def strict_pattern(ctx: Context) -> re.Pattern[str]:
+    """
+    Purge commands take an optional user before the amount,
+    so only mentions are accepted there to avoid eating the amount.
+    """
+
+    if ctx.command.name.startswith("purge"):
+        return MENTION_PATTERN
+
+    return ID_OR_MENTION_PATTERN
+
+
 class StrictUser(UserConverter):
     async def convert(self, ctx: Context, argument: str) -> User:
-        if ctx.command.name.startswith("purge"):
-            pattern = r"<@!?\d+>$"
-        else:
-            pattern = r"\d+$|<@!?\d+>$"
-
-        if re.match(pattern, argument):
+        if strict_pattern(ctx).match(argument):
             return await super().convert(ctx, argument)
 
         raise UserNotFound(argument)
@@ -60,12 +100,7 @@ class StrictUser(UserConverter):
 
 class StrictMember(MemberConverter):
     async def convert(self, ctx: Context, argument: str) -> Member:
-        if ctx.command.name.startswith("purge"):
-            pattern = r"<@!?\d+>$"
-        else:
-            pattern = r"\d+$|<@!?\d+>$"
-
-        if re.match(pattern, argument):
+        if strict_pattern(ctx).match(argument):
             return await super().convert(ctx, argument)
 
         raise MemberNotFound(argument)
@@ -89,7 +124,7 @@ class Duration(Converter[timedelta]):
         ]
 
     async def convert(self: "Duration", ctx: Context, argument: str) -> timedelta:
-        if not (matches := re.fullmatch(DURATION_PATTERN, argument, re.IGNORECASE)):
+        if not (matches := DURATION_PATTERN.fullmatch(argument)):
             raise CommandError("The duration provided didn't pass validation!")
 
         units: Dict[str, int] = {
@@ -154,23 +189,34 @@ class PartialAttachment:
 
     @staticmethod
     async def read(url: URL | str) -> tuple[bytes, str]:
-        async with ClientSession() as client:
-            async with client.get(url, proxy=config.WARP) as resp:
-                if resp.content_length and resp.content_length > 50 * 1024 * 1024:
-                    raise CommandError("Attachment exceeds the decompression limit!")
+        async with get_session().get(url, proxy=config.WARP) as resp:
+            if resp.content_length and resp.content_length > MAX_ATTACHMENT_SIZE:
+                raise CommandError("Attachment exceeds the decompression limit!")
+
+            elif resp.status == 200:
+                # The Content-Length header can be missing, so enforce the limit
+                # on the bytes which actually arrive.
+                chunks: List[bytes] = []
+                size = 0
+                async for chunk in resp.content.iter_chunked(64 * 1024):
+                    size += len(chunk)
+                    if size > MAX_ATTACHMENT_SIZE:
+                        raise CommandError(
+                            "Attachment exceeds the decompression limit!"
+                        )
 
-                elif resp.status == 200:
-                    buffer = await resp.read()
-                    return (buffer, resp.content_type)
+                    chunks.append(chunk)
 
-                elif resp.status == 404:
-                    raise NotFound(resp, "asset not found")
+                return (b"".join(chunks), resp.content_type)
 
-                elif resp.status == 403:
-                    raise Forbidden(resp, "cannot retrieve asset")
+            elif resp.status == 404:
+                raise NotFound(resp, "asset not found")
 
-                else:
-                    raise HTTPException(resp, "failed to get asset")
+            elif resp.status == 403:
+                raise Forbidden(resp, "cannot retrieve asset")
+
+            else:
+                raise HTTPException(resp, "failed to get asset")
 
     @classmethod
     def get_attachment(cls, message: Message) -> Optional[str]:
@@ -181,11 +227,12 @@ class PartialAttachment:
             return message.stickers[0].url
 
         elif message.embeds:
-            if message.embeds[0].image:
-                return message.embeds[0].image.url
+            embed = message.embeds[0]
+            if image := embed.image:
+                return image.url
 
-            elif message.embeds[0].thumbnail:
-                return message.embeds[0].thumbnail.url
+            elif thumbnail := embed.thumbnail:
+                return thumbnail.url
 
     @classmethod
     async def convert(cls, ctx: Context, argument: str) -> "PartialAttachment":
@@ -212,8 +259,9 @@ class PartialAttachment:
             attachment_url = cls.get_attachment(ctx.replied_message)
 
         else:
-            async for message in ctx.channel.history():
-                attachment_url = cls.get_attachment(message)
+            get_attachment = cls.get_attachment
+            async for message in ctx.channel.history(limit=25):
+                attachment_url = get_attachment(message)
                 if attachment_url:
                     break
 
@@ -249,6 +297,71 @@ class Timezone(Converter[str]):
         return data["location"]["tz_id"]
 
 
+TIMEFRAME_ALIASES: Dict[str, str] = {
+    alias: period
+    for period, aliases in (
+        ("7day", ("weekly", "week", "1week", "7days", "7day", "7ds", "7d")),
+        (
+            "1month",
+            ("monthly", "month", "1month", "1m", "30days", "30day", "30ds", "30d"),
+        ),
+        (
+            "3month",
+            ("3months", "3month", "3ms", "3m", "90days", "90day", "90ds", "90d"),
+        ),
+        (
+            "6month",
+            (
+                "halfyear",
+                "6months",
+                "6month",
+                "6mo",
+                "6ms",
+                "6m",
+                "180days",
+                "180day",
+                "180ds",
+                "180d",
+            ),
+        ),
+        (
+            "12month",
+            (
+                "yearly",
+                "year",
+                "yr",
+                "1year",
+                "1y",
+                "12months",
+                "12month",
+                "12mo",
+                "12ms",
+                "12m",
+                "365days",
+                "365day",
+                "365ds",
+                "365d",
+            ),
+        ),
+    )
+    for alias in aliases
+}
+TIMEFRAME_NAMES: Dict[str, str] = {
+    "7day": "weekly",
+    "1month": "monthly",
+    "3month": "past 3 months",
+    "6month": "past 6 months",
+    "12month": "yearly",
+}
+TIMEFRAME_CURRENT: Dict[str, str] = {
+    "7day": "week",
+    "1month": "month",
+    "3month": "3 months",
+    "6month": "6 months",
+    "12month": "year",
+}
+
+
 class Timeframe:
     period: Literal["overall", "7day", "1month", "3month", "6month", "12month"]
 
@@ -259,104 +372,15 @@ class Timeframe:
         self.period = period
 
     def __str__(self) -> str:
-        if self.period == "7day":
-            return "weekly"
-
-        elif self.period == "1month":
-            return "monthly"
-
-        elif self.period == "3month":
-            return "past 3 months"
-
-        elif self.period == "6month":
-            return "past 6 months"
-
-        elif self.period == "12month":
-            return "yearly"
-
-        return "overall"
+        return TIMEFRAME_NAMES.get(self.period, "overall")
 
     @property
     def current(self) -> str:
-        if self.period == "7day":
-            return "week"
-
-        elif self.period == "1month":
-            return "month"
-
-        elif self.period == "3month":
-            return "3 months"
-
-        elif self.period == "6month":
-            return "6 months"
-
-        elif self.period == "12month":
-            return "year"
-
-        return "overall"
+        return TIMEFRAME_CURRENT.get(self.period, "overall")
 
     @classmethod
     async def convert(cls, ctx: Context, argument: str) -> "Timeframe":
-        if argument in {"weekly", "week", "1week", "7days", "7day", "7ds", "7d"}:
-            return cls("7day")
-
-        elif argument in {
-            "monthly",
-            "month",
-            "1month",
-            "1m",
-            "30days",
-            "30day",
-            "30ds",
-            "30d",
-        }:
-            return cls("1month")
-
-        elif argument in {
-            "3months",
-            "3month",
-            "3ms",
-            "3m",
-            "90days",
-            "90day",
-            "90ds",
-            "90d",
-        }:
-            return cls("3month")
-
-        elif argument in {
-            "halfyear",
-            "6months",
-            "6month",
-            "6mo",
-            "6ms",
-            "6m",
-            "180days",
-            "180day",
-            "180ds",
-            "180d",
-        }:
-            return cls("6month")
-
-        elif argument in {
-            "yearly",
-            "year",
-            "yr",
-            "1year",
-            "1y",
-            "12months",
-            "12month",
-            "12mo",
-            "12ms",
-            "12m",
-            "365days",
-            "365day",
-            "365ds",
-            "365d",
-        }:
-            return cls("12month")
-
-        return cls("overall")
+        return cls(TIMEFRAME_ALIASES.get(argument, "overall"))  # type: ignore
 
 
 __all__ = (
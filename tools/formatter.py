@@ -1,12 +1,27 @@
 import re
 from datetime import timedelta
-from typing import Sequence, Set
+from functools import lru_cache
+from typing import FrozenSet, Sequence, Tuple
 
-from boltons.iterutils import remap
 from discord.utils import remove_markdown
 
-S_1 = re.compile("([A-Z][a-z]+)")
-S_2 = re.compile("([A-Z]+)")
+# Words start at an uppercase run, or at the last capital before a lowercase letter.
+SNAKE_CASE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]+[^A-Z\s-]*|[^A-Z\s-]+")
+TIMESPAN_UNITS: Tuple[Tuple[str, int], ...] = (
+    ("y", 60 * 60 * 24 * 365),
+    ("w", 60 * 60 * 24 * 7),
+    ("d", 60 * 60 * 24),
+    ("h", 60 * 60),
+    ("m", 60),
+    ("s", 1),
+)
+BROKEN_HYPERLINK = str.maketrans("", "", "[]()")
+
+
+@lru_cache(maxsize=128)
+def plural_spec(format_spec: str) -> Tuple[str, str]:
+    singular, _, plural = format_spec.partition("|")
+    return singular, plural or f"{singular}s"
 
 
 class plural:
@@ -29,8 +44,7 @@ class plural:
         elif isinstance(v, list):
             v = len(v)
 
-        singular, sep, plural = format_spec.partition("|")
-        plural = plural or f"{singular}s"
+        singular, plural = plural_spec(format_spec)
         return (
             f"{self.markdown}{v:,}{self.markdown} {plural}"
             if abs(v) != 1
@@ -43,18 +57,12 @@ def vowel(value: str) -> str:
 
 
 def duration(value: float, ms: bool = True) -> str:
-    h = int((value / (1000 * 60 * 60)) % 24) if ms else int((value / (60 * 60)) % 24)
-    m = int((value / (1000 * 60)) % 60) if ms else int((value / 60) % 60)
-    s = int((value / 1000) % 60) if ms else int(value % 60)
-
-    result = ""
-    if h:
-        result += f"{h}:"
+    m, s = divmod(int(value // 1000 if ms else value), 60)
+    h, m = divmod(m, 60)
+    h %= 24
 
-    result += f"{m}:" if m else "00:"
-    result += f"{str(s).zfill(2)}" if s else "00"
-
-    return result
+    minutes = m or "00"
+    return f"{h}:{minutes}:{s:02}" if h else f"{minutes}:{s:02}"
 
 
 def human_join(seq: Sequence[str], delim: str = ", ", final: str = "or") -> str:
@@ -79,52 +87,57 @@ def shorten(value: str, length: int = 24) -> str:
     if len(value) > length:
         value = value[: length - 2] + (".." if len(value) > length else "").strip()
 
-    BROKEN_HYPERLINK = ["[", "]", "(", ")"]
-    for char in BROKEN_HYPERLINK:
-        value = value.replace(char, "")
-
-    return remove_markdown(value)
+    return remove_markdown(value.translate(BROKEN_HYPERLINK))
 
 
-def snake_cased(s) -> str:
-    return "_".join(
-        S_1.sub(r" \1", S_2.sub(r" \1", s.replace("-", " "))).split()
-    ).lower()
+@lru_cache(maxsize=1024)
+def snake_cased(s: str) -> str:
+    return "_".join(match.group().lower() for match in SNAKE_CASE.finditer(s))
 
 
 def snake_cased_dict(
     obj: dict,
     remove_nulls: bool = True,
     all_nulls: bool = False,
-    discard_keys: Set[str] = set(),
+    discard_keys: FrozenSet[str] = frozenset(),
 ) -> dict:
-    def _visit(p, k, v):
-        k = snake_cased(str(k))
-        if k in discard_keys or (remove_nulls and ((not v and all_nulls) or v == "")):
-            return False
-        return (k, v)
+    def _is_null(v) -> bool:
+        return remove_nulls and ((not v and all_nulls) or v == "")
+
+    def _walk(v):
+        # Children are converted first, so an emptied container counts as null.
+        if isinstance(v, dict):
+            result = {}
+            for key, value in v.items():
+                key = snake_cased(str(key))
+                if key in discard_keys:
+                    continue
 
-    return remap(obj, visit=_visit)
+                value = _walk(value)
+                if not _is_null(value):
+                    result[key] = value
+
+            return result
+
+        elif isinstance(v, (list, tuple)):
+            items = [value for value in map(_walk, v) if not _is_null(value)]
+            return items if isinstance(v, list) else tuple(items)
+
+        return v
+
+    return _walk(obj)
 
 
 def short_timespan(num_seconds: float | timedelta, max_units=3, delim: str = "") -> str:
     if isinstance(num_seconds, timedelta):
         num_seconds = num_seconds.total_seconds()
 
-    units = [
-        ("y", 60 * 60 * 24 * 365),
-        ("w", 60 * 60 * 24 * 7),
-        ("d", 60 * 60 * 24),
-        ("h", 60 * 60),
-        ("m", 60),
-        ("s", 1),
-    ]
-
+    # Fractions of a second never make it into the output.
+    remaining = int(num_seconds)
     parts = []
-    for unit, div in units:
-        if num_seconds >= div:
-            val = int(num_seconds // div)
-            num_seconds %= div
+    for unit, div in TIMESPAN_UNITS:
+        if remaining >= div:
+            val, remaining = divmod(remaining, div)
             parts.append(f"{val}{unit}")
             if len(parts) == max_units:
                 break
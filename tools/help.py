@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Mapping, List, Coroutine, Any, Callable, Union, TYPE_CHECKING
+from functools import lru_cache
+from typing import Dict, Optional, Mapping, List, Coroutine, Any, Callable, Tuple, Union, TYPE_CHECKING
 import config
 from discord.ext.commands import (
     Context,
@@ -19,6 +20,104 @@ from discord.utils import MISSING
 
 from tools.paginator import Paginator 
 
+EXCLUDED_CATEGORIES = frozenset({"Jishaku", "Network", "API", "Owner"})
+PERMISSION_NAME = str.maketrans("_", " ")
+
+
+def is_extension(cog: Optional[Cog]) -> bool:
+    return cog is not None and cog.__module__.startswith("cogs.")
+
+
+def command_syntax(command: Command) -> str:
+    """
+    Build the usage of a command without the prefix.
+    The result is stored on the command, so it's only built once per load.
+    """
+
+    syntax = getattr(command, "_help_syntax", None)
+    if syntax is None:
+        parameters = getattr(command, "arguments", None)
+        if parameters is None:
+            syntax = command.qualified_name
+        else:
+            arguments = " ".join(
+                f"({parameter.name})" if not parameter.optional else f"[{parameter.name}]"
+                for parameter in parameters
+            )
+            syntax = f"{command.qualified_name} {arguments}"
+
+        command._help_syntax = syntax  # type: ignore
+
+    return syntax
+
+
+@lru_cache(maxsize=256)
+def flag_usage(annotation: FlagsMeta) -> Tuple[str, str]:
+    """
+    Format the required and optional flags of a converter.
+    Flags are declared on the class, so each converter is only formatted once.
+    """
+
+    optional: List[str] = []
+    required: List[str] = []
+    for name, flag in annotation.get_flags().items():  # type: ignore
+        (required if flag.default is MISSING else optional).append(
+            f"`--{name}{' on/off' if isinstance(flag.annotation, Status) else ''}`: {flag.description}"
+        )
+
+    return "\n".join(required), "\n".join(optional)
+
+
+@lru_cache(maxsize=1)
+def category_options(categories: Tuple[str, ...]) -> Tuple[SelectOption, ...]:
+    """
+    Build the options of the category menu.
+    They only change when a cog is added or removed.
+    """
+
+    return tuple(SelectOption(label=category, value=category) for category in categories)
+
+
+def category_commands(cog: Cog) -> Tuple[str, int]:
+    """
+    List the top level commands of a category, groups are marked with an asterisk.
+    The result is stored on the cog, so it's only built once per load.
+    """
+
+    listing = getattr(cog, "_help_commands", None)
+    if listing is None:
+        commands = cog.get_commands()
+        listing = (
+            ", ".join([f"{command.name}*" if isinstance(command, Group) else command.name for command in commands]),
+            len(commands),
+        )
+        cog._help_commands = listing  # type: ignore
+
+    return listing
+
+
+def command_permissions(command: Command) -> str:
+    """
+    Humanize the permissions required by a command.
+    The result is stored on the command, so it's only built once per load.
+    """
+
+    permissions = getattr(command, "_help_permissions", None)
+    if permissions is None:
+        required = getattr(command, "permissions", None)
+        if required is None:
+            permissions = "None"
+        else:
+            permissions = ", ".join(
+                "None" if permission == "n/a" else permission.translate(PERMISSION_NAME)
+                for permission in map(str.lower, required)
+            )
+
+        command._help_permissions = permissions  # type: ignore
+
+    return permissions
+
+
 class GreedHelp(MinimalHelpCommand):
     context: "Context"
 
@@ -32,10 +131,29 @@ class GreedHelp(MinimalHelpCommand):
             **options,
         )
         self.bot_user = None
+        self.avatar_url = None
 
     async def initialize_bot_user(self):
         if not self.bot_user:
             self.bot_user = self.context.bot.user
+            # The URL is formatted on every access, so resolve it once.
+            self.avatar_url = self.bot_user.display_avatar.url
+
+    def get_categories(self) -> Dict[str, Cog]:
+        """
+        Map the category names shown in the menu to their cog.
+        The result is kept on the bot until a cog is added or removed.
+        """
+
+        bot = self.context.bot
+        if bot.help_categories is None:
+            bot.help_categories = {
+                cog.qualified_name: cog
+                for cog in sorted(bot.cogs.values(), key=lambda cog: cog.qualified_name)
+                if cog.qualified_name not in EXCLUDED_CATEGORIES and is_extension(cog)
+            }
+
+        return bot.help_categories
 
 
 
@@ -51,16 +169,13 @@ class GreedHelp(MinimalHelpCommand):
                   "**[View on Web](https://skunkk.xyz)**",
             inline=False
         )
-        embed.set_author(name=f"Greed Command Menu", icon_url=ctx.bot.user.display_avatar.url, url=config.CLIENT.SUPPORT_URL)
+        embed.set_author(name=f"Greed Command Menu", icon_url=self.avatar_url, url=config.CLIENT.SUPPORT_URL)
         embed.set_footer(text="Select a category from the dropdown menu below")
         return embed
 
     async def send_default_help_message(self, command: Command):
         await self.initialize_bot_user()
-        try:
-            syntax = f"{self.context.clean_prefix}{command.qualified_name} {' '.join([f'({parameter.name})' if not parameter.optional else f'[{parameter.name}]' for parameter in command.arguments])}"
-        except AttributeError:
-            syntax = f"{self.context.clean_prefix}{command.qualified_name}"
+        syntax = f"{self.context.clean_prefix}{command_syntax(command)}"
         
         embed = Embed(
             color=config.Colors.greed,
@@ -80,13 +195,9 @@ class GreedHelp(MinimalHelpCommand):
         await self.initialize_bot_user()
         bot = self.context.bot
         embed = self.create_main_help_embed(self.context)
-        embed.set_thumbnail(url=bot.user.display_avatar.url)
+        embed.set_thumbnail(url=self.avatar_url)
         
-        categories = sorted([
-            cog.qualified_name if cog else "No Category"
-            for cog in mapping.keys()
-            if cog and cog.qualified_name not in ["Jishaku", "Network", "API", "Owner"] and "cogs" in cog.__module__
-        ])
+        categories = self.get_categories()
         
         if not categories:
             await self.context.reply("No categories available.")
@@ -94,7 +205,7 @@ class GreedHelp(MinimalHelpCommand):
         
         select = Select(
             placeholder="Choose a category...",
-            options=[SelectOption(label=category, value=category) for category in categories]
+            options=[*category_options(tuple(categories))],
         )
 
         async def select_callback(interaction: Interaction):
@@ -103,16 +214,15 @@ class GreedHelp(MinimalHelpCommand):
                 return
 
             selected_category = interaction.data['values'][0] # type: ignore
-            selected_cog = next((cog for cog in mapping.keys() if (cog and cog.qualified_name == selected_category) or (not cog and selected_category == "No Category")), None)
-            commands = mapping[selected_cog]
-            command_list = ", ".join([f"{command.name}*" if isinstance(command, Group) else f"{command.name}" for command in commands])
+            cog = self.get_categories().get(selected_category)
+            command_list, amount = category_commands(cog) if cog else ("", 0)
             embed = Embed(
                 title=f"Category: {selected_category}",
                 description=f"```\n{command_list}\n```",
                 color=config.Colors.greed
             )
-            embed.set_author(name=f"{bot.user.name} Command Menu", icon_url=bot.user.display_avatar.url)
-            embed.set_footer(text=f"{len(commands)} command{'s' if len(commands) != 1 else ''}")
+            embed.set_author(name=f"{bot.user.name} Command Menu", icon_url=self.avatar_url)
+            embed.set_footer(text=f"{amount} command{'s' if amount != 1 else ''}")
             await interaction.response.edit_message(embed=embed, view=view)
 
         select.callback = select_callback
@@ -127,22 +237,12 @@ class GreedHelp(MinimalHelpCommand):
         await self.initialize_bot_user()
         embeds = []
         bot = self.context.bot
+        author_avatar_url = self.context.author.display_avatar.url
         for command in group.commands:
-            if "cogs" not in command.cog.__module__:
+            if not is_extension(command.cog):
                 continue
-            try:
-                syntax = f"{self.context.clean_prefix}{command.qualified_name} {' '.join([f'({parameter.name})' if not parameter.optional else f'[{parameter.name}]' for parameter in command.arguments])}"
-            except AttributeError:
-                syntax = f"{self.context.clean_prefix}{command.qualified_name}"
-            try:
-                permissions = ", ".join(
-                    [
-                        permission.lower().replace("n/a", "None").replace("_", " ")
-                        for permission in command.permissions
-                    ]
-                )
-            except AttributeError:
-                permissions = "None"
+            syntax = f"{self.context.clean_prefix}{command_syntax(command)}"
+            permissions = command_permissions(command)
             
             brief = command.brief or ""
             if permissions != "None" and brief:
@@ -171,8 +271,8 @@ class GreedHelp(MinimalHelpCommand):
                     self._add_flag_formatting(param.annotation, embed)  # type: ignore
             
             embed.set_footer(
-                text=f"Aliases: {', '.join(a for a in command.aliases) if len(command.aliases) > 0 else 'none'} ",
-                icon_url=self.context.author.display_avatar.url,
+                text=f"Aliases: {', '.join(command.aliases) or 'none'} ",
+                icon_url=author_avatar_url,
             )
             embeds.append(embed)  # Moved outside the parameter loop
         
@@ -184,23 +284,12 @@ class GreedHelp(MinimalHelpCommand):
 
     async def send_command_help(self, command: Command):
         await self.initialize_bot_user()
-        if command.cog is None or "cogs" not in getattr(command.cog, '__module__', ''):
+        if not is_extension(command.cog):
             await self.send_default_help_message(command)
             return
         bot = self.context.bot
-        try:
-            syntax = f"{self.context.clean_prefix}{command.qualified_name} {' '.join([f'({parameter.name})' if not parameter.optional else f'[{parameter.name}]' for parameter in command.arguments])}"
-        except AttributeError:
-            syntax = f"{self.context.clean_prefix}{command.qualified_name}"
-        try:
-            permissions = ", ".join(
-                [
-                    permission.lower().replace("n/a", "None").replace("_", " ")
-                    for permission in command.permissions
-                ]
-            )
-        except AttributeError:
-            permissions = "None"
+        syntax = f"{self.context.clean_prefix}{command_syntax(command)}"
+        permissions = command_permissions(command)
         
         brief = command.brief or ""
         if permissions != "None" and brief:
@@ -214,7 +303,7 @@ class GreedHelp(MinimalHelpCommand):
                 title=f"Command: {command.qualified_name} • {command.cog_name} module",
                 description=f"{command.description.capitalize() if command.description else (command.help.capitalize() if command.help else None)}",
             )
-            .set_author(name=f"{bot.user.name} help", icon_url=bot.user.display_avatar.url)
+            .set_author(name=f"{bot.user.name} help", icon_url=self.avatar_url)
             .add_field(
                 name="",
                 value=f"```Ruby\nSyntax: {syntax}\nExample: {self.context.clean_prefix}{command.qualified_name} {command.example or ''}```",
@@ -230,7 +319,7 @@ class GreedHelp(MinimalHelpCommand):
             if isinstance(param.annotation, FlagsMeta):
                 self._add_flag_formatting(param.annotation, embed)  # type: ignore
         embed.set_footer(
-            text=f"Aliases: {', '.join(a for a in command.aliases) if len(command.aliases) > 0 else 'none'} • skunkk.xyz",
+            text=f"Aliases: {', '.join(command.aliases) or 'none'} • skunkk.xyz",
             icon_url=self.context.author.display_avatar.url,
         )
     
@@ -280,19 +369,10 @@ class GreedHelp(MinimalHelpCommand):
 
 
     def _add_flag_formatting(self, annotation: FlagConverter, embed: Embed):
-        optional: List[str] = [
-            f"`--{name}{' on/off' if isinstance(flag.annotation, Status) else ''}`: {flag.description}"
-            for name, flag in annotation.get_flags().items()
-            if flag.default is not MISSING
-        ]
-        required: List[str] = [
-            f"`--{name}{' on/off' if isinstance(flag.annotation, Status) else ''}`: {flag.description}"
-            for name, flag in annotation.get_flags().items()
-            if flag.default is MISSING
-        ]
+        required, optional = flag_usage(annotation)  # type: ignore
 
         if required:
-            embed.add_field(name="Required Flags", value="\n".join(required), inline=True)
+            embed.add_field(name="Required Flags", value=required, inline=True)
 
         if optional:
-            embed.add_field(name="Optional Flags", value="\n".join(optional), inline=True)
\ No newline at end of file
+            embed.add_field(name="Optional Flags", value=optional, inline=True)
\ No newline at end of file
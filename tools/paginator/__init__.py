@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import suppress
-from math import ceil
 from typing import TYPE_CHECKING, List, Optional, cast
 
 from discord import ButtonStyle, Color, Embed, HTTPException, Interaction, Message
@@ -14,11 +13,20 @@ from tools import Button, View
 if TYPE_CHECKING:
     from tools.client import Context
 
+# Items are bound to their view, so only the specs are shared between paginators.
+BUTTONS = (
+    ("previous", ButtonStyle.secondary, EMOJIS.PAGINATOR.PREVIOUS or "⬅"),
+    ("navigation", ButtonStyle.primary, EMOJIS.PAGINATOR.NAVIGATE or "🔢"),
+    ("next", ButtonStyle.secondary, EMOJIS.PAGINATOR.NEXT or "➡"),
+    ("cancel", ButtonStyle.primary, EMOJIS.PAGINATOR.CANCEL or "⏹"),
+)
+
 
 class Paginator(View):
     entries: List[str] | List[Embed]
     message: Message
     index: int
+    text_only: bool
 
     def __init__(
         self,
@@ -32,9 +40,13 @@ class Paginator(View):
         super().__init__(timeout=60)
         self.ctx = ctx
         self.entries = self.prepare_entries(entries, embed, per_page, counter)
+        # The pages are homogeneous, so check their type once.
+        self.text_only = bool(self.entries) and isinstance(self.entries[0], str)
         self.message = None  # type: ignore
         self.index = 0
-        self.add_buttons()
+        # A single page is sent without the view, so it doesn't need any buttons.
+        if len(self.entries) > 1:
+            self.add_buttons()
         # self.ctx.bot.loop.create_task(self.start())
 
     async def interaction_check(self, interaction: Interaction) -> bool:
@@ -55,29 +67,8 @@ class Paginator(View):
         return await super().on_timeout()
 
     def add_buttons(self):
-        for button in (
-            Button(
-                custom_id="previous",
-                style=ButtonStyle.secondary,
-                emoji=EMOJIS.PAGINATOR.PREVIOUS or "⬅",
-            ),
-            Button(
-                custom_id="navigation",
-                style=ButtonStyle.primary,
-                emoji=EMOJIS.PAGINATOR.NAVIGATE or "🔢",
-            ),
-            Button(
-                custom_id="next",
-                style=ButtonStyle.secondary,
-                emoji=EMOJIS.PAGINATOR.NEXT or "➡",
-            ),
-            Button(
-                custom_id="cancel",
-                style=ButtonStyle.primary,
-                emoji=EMOJIS.PAGINATOR.CANCEL or "⏹",
-            ),
-        ):
-            self.add_item(button)
+        for custom_id, style, emoji in BUTTONS:
+            self.add_item(Button(custom_id=custom_id, style=style, emoji=emoji))
 
     def prepare_entries(
         self,
@@ -93,119 +84,127 @@ class Paginator(View):
         If the first item is a dictionary then we'll use fields instead of the description.
         """
 
-        compiled: List[str | Embed] = []
-        pages = ceil(len(entries) / per_page)
-
-        if not embed:
-            if isinstance(entries[0], str):
-                entries = cast(List[str], entries)
-
-                for index, entry in enumerate(entries):
-                    if "page" not in entry and counter:
-                        entry = f"({index + 1}/{len(entries)}) {entry}"
-
-                    entry = entry.format(page=index + 1, pages=len(entries))
-                    compiled.append(entry)
-
-        elif not entries:
-            compiled.append(embed)
-
-        elif isinstance(entries[0], str):
-            offset = 0
-
-            for chunk in as_chunks(entries, per_page):
-                entry = embed.copy()
-                if not entry.color:
-                    entry.color = self.ctx.color
-
-                entry.description = f"{entry.description or ''}\n\n"
-
-                for value in chunk:
-                    offset += 1
-                    entry.description += (
-                        f"`{offset}` {value}\n" if counter else f"{value}\n"
-                    )
-
-                if pages > 1:
-                    footer = entry.footer
-                    if footer and footer.text:
-                        entry.set_footer(
-                            text=" • ".join(
-                                [
-                                    footer.text,
-                                    f"Page {len(compiled) + 1} of {pages:,}",
-                                ]
-                            ),
-                            icon_url=footer.icon_url,
-                        )
-
-                    else:
-                        entry.set_footer(
-                            text=f"Page {len(compiled) + 1} of {pages:,}",
-                        )
-
-                compiled.append(entry)
-
-        elif isinstance(entries[0], dict):
-            entries = cast(List[dict], entries)
-            pages = ceil(len(entries) / per_page)
-
-            for chunk in as_chunks(entries, per_page):
-                entry = embed.copy()
-                if not entry.color:
-                    entry.color = self.ctx.color
-
-                for field in chunk:
-                    entry.add_field(**field)
-
-                if pages > 1:
-                    footer = entry.footer
-                    if footer and footer.text:
-                        entry.set_footer(
-                            text=" • ".join(
-                                [
-                                    footer.text,
-                                    f"Page {len(compiled) + 1} of {pages}",
-                                ]
-                            ),
-                            icon_url=footer.icon_url,
-                        )
-
-                    else:
-                        entry.set_footer(
-                            text=f"Page {len(compiled) + 1} of {pages}",
-                        )
-
-                compiled.append(entry)
-
-        if entries and isinstance(entries[0], Embed):
-            pages = len(entries)
-            for index, entry in enumerate(entries):
-                entry = cast(Embed, entry)
-                if not entry.color:
-                    entry.color = self.ctx.color
-
-                if len(entries) > 1:
-                    footer = entry.footer
-                    if footer and footer.text:
-                        entry.set_footer(
-                            text=" • ".join(
-                                [
-                                    footer.text,
-                                    f"Page {len(compiled) + 1} of {pages}",
-                                ]
-                            ),
-                            icon_url=footer.icon_url,
-                        )
-
-                    else:
-                        entry.set_footer(
-                            text=f"Page {len(compiled) + 1} of {pages}",
-                        )
-
-                compiled.append(entry)
-
-        return compiled  # type: ignore
+        if not entries:
+            return [embed] if embed else []
+
+        # The entries are homogeneous, so the first one decides the layout.
+        first = entries[0]
+        if isinstance(first, Embed):
+            return self.prepare_embeds(cast(List[Embed], entries))
+
+        elif not embed:
+            if isinstance(first, str):
+                return self.prepare_strings(cast(List[str], entries), counter)
+
+        elif isinstance(first, str):
+            return self.prepare_description(
+                cast(List[str], entries), embed, per_page, counter
+            )
+
+        elif isinstance(first, dict):
+            return self.prepare_fields(cast(List[dict], entries), embed, per_page)
+
+        return []
+
+    def format_page(
+        self,
+        entry: Embed,
+        page: int,
+        pages: int,
+        grouped: bool = False,
+    ) -> None:
+        if not entry.color:
+            entry.color = self.ctx.color
+
+        if pages > 1:
+            # Only the description pages have always grouped the page count.
+            total = f"{pages:,}" if grouped else str(pages)
+            footer = entry.footer
+            if footer and footer.text:
+                entry.set_footer(
+                    text=f"{footer.text} • Page {page} of {total}",
+                    icon_url=footer.icon_url,
+                )
+
+            else:
+                entry.set_footer(text=f"Page {page} of {total}")
+
+    def prepare_strings(self, entries: List[str], counter: bool) -> List[str]:
+        compiled: List[str] = []
+        pages = len(entries)
+
+        for index, entry in enumerate(entries, start=1):
+            if "page" not in entry and counter:
+                entry = f"({index}/{pages}) {entry}"
+
+            compiled.append(entry.format(page=index, pages=pages))
+
+        return compiled
+
+    def prepare_description(
+        self,
+        entries: List[str],
+        embed: Embed,
+        per_page: int,
+        counter: bool,
+    ) -> List[Embed]:
+        compiled: List[Embed] = []
+        pages = -(-len(entries) // per_page)
+        offset = 0
+
+        # Serialize the template once, every page is rebuilt from the snapshot.
+        template = embed.to_dict()
+        description = template.get("description") or ""
+
+        for page, chunk in enumerate(as_chunks(entries, per_page), start=1):
+            if counter:
+                lines = "\n".join(
+                    f"`{number}` {value}"
+                    for number, value in enumerate(chunk, start=offset + 1)
+                )
+            else:
+                lines = "\n".join(map(str, chunk))
+
+            offset += len(chunk)
+            entry = Embed.from_dict(
+                {**template, "description": f"{description}\n\n{lines}\n"}
+            )
+
+            self.format_page(entry, page, pages, grouped=True)
+            compiled.append(entry)
+
+        return compiled
+
+    def prepare_fields(
+        self,
+        entries: List[dict],
+        embed: Embed,
+        per_page: int,
+    ) -> List[Embed]:
+        compiled: List[Embed] = []
+        pages = -(-len(entries) // per_page)
+
+        template = embed.to_dict()
+        fields = template.get("fields", [])
+
+        for page, chunk in enumerate(as_chunks(entries, per_page), start=1):
+            # Embed.from_dict keeps a reference to the field list,
+            # so every page needs its own copy to append to.
+            entry = Embed.from_dict({**template, "fields": [*fields]})
+            for field in chunk:
+                entry.add_field(**field)
+
+            self.format_page(entry, page, pages)
+            compiled.append(entry)
+
+        return compiled
+
+    def prepare_embeds(self, entries: List[Embed]) -> List[Embed]:
+        pages = len(entries)
+        for page, entry in enumerate(entries, start=1):
+            self.format_page(entry, page, pages)
+
+        return entries
 
     async def start(self) -> Message:
         if not self.entries:
@@ -215,28 +214,26 @@ class Paginator(View):
         if len(self.entries) == 1:
             self.message = (
                 await self.ctx.send(content=page)
-                if isinstance(page, str)
+                if self.text_only
                 else await self.ctx.send(embed=page)
             )
         else:
             self.message = (
                 await self.ctx.send(content=page, view=self)
-                if isinstance(page, str)
+                if self.text_only
                 else await self.ctx.send(embed=page, view=self)
             )
 
         return self.message
 
     async def callback(self, interaction: Interaction, button: Button):
-        await interaction.response.defer()
-
         if button.custom_id == "previous":
             self.index = len(self.entries) - 1 if self.index <= 0 else self.index - 1
         elif button.custom_id == "next":
             self.index = 0 if self.index >= (len(self.entries) - 1) else self.index + 1
         elif button.custom_id == "navigation":
             await self.disable_buttons()
-            await self.message.edit(view=self)
+            await interaction.response.edit_message(view=self)
 
             embed = Embed(
                 title="Page Navigation",
@@ -247,15 +244,21 @@ class Paginator(View):
             )
             response: Optional[Message] = None
 
+            # Every message the bot receives runs through the check,
+            # so it only compares ids and values captured up front.
+            author_id = interaction.user.id
+            channel_id = interaction.channel_id
+            pages = len(self.entries)
+
             try:
                 response = await self.ctx.bot.wait_for(
                     "message",
                     timeout=6,
                     check=lambda m: (
-                        m.author == interaction.user
-                        and m.channel == interaction.channel
+                        m.author.id == author_id
+                        and m.channel.id == channel_id
                         and m.content.isdigit()
-                        and int(m.content) <= len(self.entries)
+                        and int(m.content) <= pages
                     ),
                 )
             except asyncio.TimeoutError:
@@ -266,11 +269,12 @@ class Paginator(View):
                 for child in self.children:
                     child.disabled = False  # type: ignore
 
-                with suppress(HTTPException):
-                    await prompt.delete()
-                    if response:
-                        await response.delete()
+                await asyncio.gather(
+                    *(message.delete() for message in (prompt, response) if message),
+                    return_exceptions=True,
+                )
         elif button.custom_id == "cancel":
+            await interaction.response.defer()
             with suppress(HTTPException):
                 await self.message.delete()
                 await self.ctx.message.delete()
@@ -278,9 +282,16 @@ class Paginator(View):
 
             return
 
+        # Page turns are acknowledged by the edit itself,
+        # navigation already used the response to disable the buttons.
+        edit = (
+            self.message.edit
+            if interaction.response.is_done()
+            else interaction.response.edit_message
+        )
         page = self.entries[self.index]
         with suppress(HTTPException):
-            if isinstance(page, str):
-                await self.message.edit(content=page, view=self)
+            if self.text_only:
+                await edit(content=page, view=self)
             else:
-                await self.message.edit(embed=page, view=self)
+                await edit(embed=page, view=self)
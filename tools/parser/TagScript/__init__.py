@@ -1,15 +1,105 @@
 from collections import namedtuple
-
-from .adapter import *
-from .block import *
-from .exceptions import *
-from .interface import *
-from .interpreter import *
-from .utils import *
-from .verb import Verb
+from importlib import import_module
 
 __version__ = "2.6.4"
 
+# The submodules are only imported once one of their names is accessed,
+# so importing the exceptions doesn't load the whole engine.
+LAZY_IMPORTS = {
+    name: module
+    for module, names in (
+        (
+            ".adapter",
+            (
+                "SafeObjectAdapter",
+                "StringAdapter",
+                "IntAdapter",
+                "FunctionAdapter",
+                "AttributeAdapter",
+                "MemberAdapter",
+                "ChannelAdapter",
+                "GuildAdapter",
+            ),
+        ),
+        (
+            ".block",
+            (
+                "implicit_bool",
+                "helper_parse_if",
+                "helper_parse_list_if",
+                "helper_split",
+                "AllBlock",
+                "AnyBlock",
+                "AssignmentBlock",
+                "BlacklistBlock",
+                "BreakBlock",
+                "CommandBlock",
+                "CooldownBlock",
+                "EmbedBlock",
+                "FiftyFiftyBlock",
+                "IfBlock",
+                "LooseVariableGetterBlock",
+                "MathBlock",
+                "OverrideBlock",
+                "PythonBlock",
+                "RandomBlock",
+                "RangeBlock",
+                "RedirectBlock",
+                "ReplaceBlock",
+                "RequireBlock",
+                "ShortCutRedirectBlock",
+                "StopBlock",
+                "StrfBlock",
+                "StrictVariableGetterBlock",
+                "SubstringBlock",
+                "URLEncodeBlock",
+            ),
+        ),
+        (
+            ".exceptions",
+            (
+                "TagScriptError",
+                "WorkloadExceededError",
+                "ProcessError",
+                "EmbedParseError",
+                "BadColourArgument",
+                "StopError",
+                "CooldownExceeded",
+            ),
+        ),
+        (".interface", ("Adapter", "Block", "verb_required_block")),
+        (
+            ".interpreter",
+            (
+                "Interpreter",
+                "AsyncInterpreter",
+                "Context",
+                "Response",
+                "Node",
+                "build_node_tree",
+            ),
+        ),
+        (".utils", ("escape_content", "maybe_await", "DPY2")),
+        (".verb", ("Verb",)),
+    )
+    for name in names
+}
+
+
+def __getattr__(name: str):
+    try:
+        module = LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *LAZY_IMPORTS})
+
 
 class VersionInfo(namedtuple("VersionInfo", "major minor micro")):
     """
@@ -36,7 +126,7 @@ class VersionInfo(namedtuple("VersionInfo", "major minor micro")):
         str
             String representation of the version information.
         """
-        return "{major}.{minor}.{micro}".format(**self._asdict())
+        return f"{self.major}.{self.minor}.{self.micro}"
 
     @classmethod
     def from_str(cls, version):
@@ -53,7 +143,8 @@ class VersionInfo(namedtuple("VersionInfo", "major minor micro")):
         VersionInfo
             Version information.
         """
-        return cls(*map(int, version.split(".")))
+        major, minor, micro = version.split(".")
+        return cls(int(major), int(minor), int(micro))
 
 
 version_info = VersionInfo.from_str(__version__)
@@ -1,6 +1,8 @@
 from random import choice
+from typing import FrozenSet, Tuple
 
 import discord
+from cachetools import LRUCache
 from humanize import ordinal
 
 from ..interface import Adapter
@@ -15,9 +17,41 @@ __all__ = (
 )
 
 
+# The member count is part of the key, so a join or leave invalidates the rank.
+JOIN_POSITIONS: LRUCache[Tuple[int, int, int], int] = LRUCache(maxsize=10_000)
+
+
+def join_position(member: discord.Member) -> int:
+    guild = member.guild
+    key = (guild.id, member.id, len(guild.members))
+    if (position := JOIN_POSITIONS.get(key)) is not None:
+        return position
+
+    # Only the member's rank is needed, so count the earlier joins
+    # instead of sorting the whole member list.
+    joined = member.joined_at or member.created_at
+    position = JOIN_POSITIONS[key] = sum(
+        1
+        for other in guild.members
+        if (other.joined_at or other.created_at) < joined
+    )
+    return position
+
+
+def mentions(channels, ordered: bool = False) -> str:
+    # The guild's typed listings are sorted by position, so ordered keeps that.
+    if ordered:
+        channels = sorted(channels, key=lambda c: (c.position, c.id))
+
+    return ", ".join([c.mention for c in channels])
+
+
 class AttributeAdapter(Adapter):
     __slots__ = ("object", "_attributes", "_methods")
 
+    # Parameters whose values are escaped before they're returned.
+    ESCAPED_ATTRIBUTES: FrozenSet[str] = frozenset()
+
     def __init__(self, base):
         self.object = base
         created_at = getattr(base, "created_at", None) or discord.utils.snowflake_time(
@@ -44,25 +78,25 @@ class AttributeAdapter(Adapter):
         pass
 
     def get_value(self, ctx: Verb) -> str:
-        should_escape = False
+        parameter = ctx.parameter
+        if parameter is None:
+            return str(self.object)
 
-        if ctx.parameter is None:
-            return_value = str(self.object)
-        else:
-            try:
-                value = self._attributes[ctx.parameter]
-            except KeyError:
-                if method := self._methods.get(ctx.parameter):
-                    value = method()
-                else:
-                    return
+        try:
+            value = self._attributes[parameter]
+        except KeyError:
+            if method := self._methods.get(parameter):
+                value = method()
+            else:
+                return
 
-            if isinstance(value, tuple):
-                value, should_escape = value
+        if value is None:
+            return None
 
-            return_value = str(value) if value is not None else None
+        if parameter in self.ESCAPED_ATTRIBUTES:
+            return escape_content(str(value))
 
-        return escape_content(return_value) if should_escape else return_value
+        return str(value)
 
 
 class MemberAdapter(AttributeAdapter):
@@ -84,10 +118,6 @@ class MemberAdapter(AttributeAdapter):
 
     def update_attributes(self):
         member = self.object
-        join_pos = sorted(
-            member.guild.members,
-            key=lambda member: member.joined_at or member.created_at,
-        ).index(member)
         joined_at = getattr(member, "joined_at", member.created_at)
 
         self._attributes.update(
@@ -107,13 +137,33 @@ class MemberAdapter(AttributeAdapter):
                 if member.premium_since
                 else None,
                 "top_role": getattr(member, "top_role", ""),
-                "join_position": join_pos,
-                "join_position_suffix": ordinal(join_pos),
-                "roles": ", ".join(r.name for r in reversed(member.roles)),
-                "role_ids": ", ".join(str(r.id) for r in reversed(member.roles)),
             }
         )
 
+    def update_methods(self):
+        # These walk the guild or the member's roles,
+        # so they're only resolved when a tag asks for them.
+        self._methods.update(
+            {
+                "join_position": self.join_position,
+                "join_position_suffix": self.join_position_suffix,
+                "roles": self.role_names,
+                "role_ids": self.role_ids,
+            }
+        )
+
+    def join_position(self) -> int:
+        return join_position(self.object)
+
+    def join_position_suffix(self) -> str:
+        return ordinal(join_position(self.object))
+
+    def role_names(self) -> str:
+        return ", ".join([r.name for r in reversed(self.object.roles)])
+
+    def role_ids(self) -> str:
+        return ", ".join([str(r.id) for r in reversed(self.object.roles)])
+
 
 class ChannelAdapter(AttributeAdapter):
     """
@@ -211,6 +261,21 @@ class GuildAdapter(AttributeAdapter):
 
     def update_attributes(self):
         guild = self.object
+        # guild.members builds a new list on every access,
+        # so the count and the random member share this one.
+        self._members = members = guild.members
+        # The guild's channel properties each scan every channel,
+        # so they're bucketed by type in a single pass instead.
+        self._channels = channels = guild.channels
+        self._buckets = buckets = {
+            discord.TextChannel: [],
+            discord.VoiceChannel: [],
+            discord.CategoryChannel: [],
+        }
+        for channel in channels:
+            if (bucket := buckets.get(type(channel))) is not None:
+                bucket.append(channel)
+
         self._attributes.update(
             {
                 "icon": guild.icon,
@@ -220,17 +285,13 @@ class GuildAdapter(AttributeAdapter):
                 "owner_id": guild.owner_id,
                 "shard": guild.shard_id,
                 "description": guild.description,
-                "count": len(guild.members),
+                "count": len(members),
                 "emoji_count": len(guild.emojis),
                 "role_count": len(guild.roles),
-                "channels": ", ".join(c.mention for c in guild.channels),
-                "channel_count": len(guild.channels),
-                "text_channels": ", ".join(c.mention for c in guild.text_channels),
-                "text_channel_count": len(guild.text_channels),
-                "voice_channels": ", ".join(c.mention for c in guild.voice_channels),
-                "voice_channel_count": len(guild.voice_channels),
-                "category_channels": ", ".join(c.mention for c in guild.categories),
-                "category_count": len(guild.categories),
+                "channel_count": len(channels),
+                "text_channel_count": len(buckets[discord.TextChannel]),
+                "voice_channel_count": len(buckets[discord.VoiceChannel]),
+                "category_count": len(buckets[discord.CategoryChannel]),
                 "boost_count": guild.premium_subscription_count,
                 "boost_level": guild.premium_tier,
                 "boost_tier": guild.premium_tier,
@@ -238,8 +299,19 @@ class GuildAdapter(AttributeAdapter):
         )
 
     def update_methods(self):
-        additional_methods = {"random": self.random_member}
+        # The channel listings mention every channel,
+        # so they're only joined when a tag asks for them.
+        buckets = self._buckets
+        additional_methods = {
+            "random": self.random_member,
+            "channels": lambda: mentions(self._channels),
+            "text_channels": lambda: mentions(buckets[discord.TextChannel], True),
+            "voice_channels": lambda: mentions(buckets[discord.VoiceChannel], True),
+            "category_channels": lambda: mentions(
+                buckets[discord.CategoryChannel], True
+            ),
+        }
         self._methods.update(additional_methods)
 
     def random_member(self):
-        return choice(self.object.members)
+        return choice(self._members)
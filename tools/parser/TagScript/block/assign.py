@@ -32,9 +32,12 @@ class AssignmentBlock(verb_required_block(False, parameter=True)):
     ACCEPTED_NAMES = ("=", "assign", "let", "var")
 
     def process(self, ctx: Context) -> Optional[str]:
-        if ctx.verb.parameter is None:
+        verb = ctx.verb
+        if (parameter := verb.parameter) is None:
             return None
-        ctx.response.variables[ctx.verb.parameter] = StringAdapter(
-            str(ctx.verb.payload)
+        # A missing payload is still stored as "None", like str() did before.
+        payload = verb.payload
+        ctx.response.variables[parameter] = StringAdapter(
+            payload if type(payload) is str else str(payload)
         )
         return ""
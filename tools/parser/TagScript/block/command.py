@@ -3,6 +3,9 @@ from typing import Optional
 from ..interface import Block, verb_required_block
 from ..interpreter import Context
 
+OVERRIDES = ("admin", "mod", "permissions")
+OVERRIDE_NAMES = frozenset(OVERRIDES)
+
 
 class CommandBlock(verb_required_block(True, payload=True)):
     """
@@ -34,13 +37,10 @@ class CommandBlock(verb_required_block(True, payload=True)):
 
     def process(self, ctx: Context) -> Optional[str]:
         command = ctx.verb.payload.strip()
-        actions = ctx.response.actions.get("commands")
-        if actions:
-            if len(actions) >= self.limit:
-                return f"`COMMAND LIMIT REACHED ({self.limit})`"
-        else:
-            ctx.response.actions["commands"] = []
-        ctx.response.actions["commands"].append(command)
+        actions = ctx.response.actions.setdefault("commands", [])
+        if len(actions) >= self.limit:
+            return f"`COMMAND LIMIT REACHED ({self.limit})`"
+        actions.append(command)
         return ""
 
 
@@ -78,21 +78,17 @@ class OverrideBlock(Block):
     ACCEPTED_NAMES = ("override",)
 
     def process(self, ctx: Context) -> Optional[str]:
+        actions = ctx.response.actions
         param = ctx.verb.parameter
         if not param:
-            ctx.response.actions["overrides"] = {
-                "admin": True,
-                "mod": True,
-                "permissions": True,
-            }
+            actions["overrides"] = dict.fromkeys(OVERRIDES, True)
             return ""
 
         param = param.strip().lower()
-        if param not in ("admin", "mod", "permissions"):
+        if param not in OVERRIDE_NAMES:
             return None
-        overrides = ctx.response.actions.get(
-            "overrides", {"admin": False, "mod": False, "permissions": False}
-        )
+        # The defaults are only built for the first override of a tag.
+        if (overrides := actions.get("overrides")) is None:
+            overrides = actions["overrides"] = dict.fromkeys(OVERRIDES, False)
         overrides[param] = True
-        ctx.response.actions["overrides"] = overrides
         return ""
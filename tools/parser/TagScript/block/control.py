@@ -1,20 +1,26 @@
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from ..interface import verb_required_block
 from ..interpreter import Context
 from . import helper_parse_if, helper_parse_list_if, helper_split
 
 
+@lru_cache(maxsize=1024)
+def split_output(payload: str) -> Optional[Tuple[str, str]]:
+    # Templates render the same payload over and over, so the split is kept.
+    output = helper_split(payload, False)
+    if output is not None and len(output) == 2:
+        return output[0], output[1]
+
+
 def parse_into_output(payload: str, result: Optional[bool]) -> Optional[str]:
     if result is None:
         return
     try:
-        output = helper_split(payload, False)
-        if output != None and len(output) == 2:
-            if result:
-                return output[0]
-            else:
-                return output[1]
+        output = split_output(payload)
+        if output is not None:
+            return output[0] if result else output[1]
         elif result:
             return payload
         else:
@@ -1,6 +1,7 @@
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Optional
 
+from cachetools import LRUCache
 from discord.ext.commands import CooldownMapping
 
 from ..exceptions import CooldownExceeded
@@ -44,7 +45,9 @@ class CooldownBlock(verb_required_block(True, payload=True, parameter=True)):
     """
 
     ACCEPTED_NAMES = ("cooldown",)
-    COOLDOWNS: Dict[Any, CooldownMapping] = {}
+    # Keyed by the tag script, so the least recently used scripts are evicted
+    # instead of every script ever run staying in memory.
+    COOLDOWNS: LRUCache[Any, CooldownMapping] = LRUCache(maxsize=10_000)
 
     @classmethod
     def create_cooldown(cls, key: Any, rate: int, per: int) -> CooldownMapping:
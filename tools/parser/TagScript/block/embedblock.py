@@ -10,21 +10,31 @@ from ..interface import Block
 from ..interpreter import Context
 from .helpers import helper_split, implicit_bool
 
+EMBED_ATTRIBUTE = re.compile(r"(?P<name>[^:]+):\s*(?P<value>[^}]+)")
+# Unknown colours fall back to this, nothing mutates a colour once it's parsed.
+DEFAULT_COLOUR = Colour.default()
+# Named colours like ``blurple`` are classmethods on Colour, the from_* parsers aren't names.
+COLOUR_FACTORIES = {
+    name: method
+    for name in dir(Colour)
+    if not name.startswith(("_", "from_")) and ismethod(method := getattr(Colour, name))
+}
+
 
 def string_to_color(argument: str) -> Colour:
     arg = argument.replace("0x", "").lower()
 
     if arg[0] == "#":
         arg = arg[1:]
+    # No colour name is a valid hex number, so names are looked up
+    # first and don't go through a failed int() parse.
+    if method := COLOUR_FACTORIES.get(arg.replace(" ", "_")):
+        return method()
     try:
         value = int(arg, base=16)
-        return Colour.default() if not (0 <= value <= 0xFFFFFF) else Colour(value=value)
+        return DEFAULT_COLOUR if not (0 <= value <= 0xFFFFFF) else Colour(value=value)
     except ValueError:
-        arg = arg.replace(" ", "_")
-        method = getattr(Colour, arg, None)
-        if arg.startswith("from_") or method is None or not ismethod(method):
-            return Colour.default()
-        return method()
+        return DEFAULT_COLOUR
 
 
 def set_color(embed: Embed, attribute: str, value: str):
@@ -144,7 +154,8 @@ class EmbedBlock(Block):
         "footer": set_footer,
     }
 
-    ACCEPTED_NAMES = ("embed", "Embed", *ATTRIBUTE_HANDLERS.keys())
+    # will_accept lowercases the declaration, so a set of lowercase names is enough.
+    ACCEPTED_NAMES = frozenset({"embed", *ATTRIBUTE_HANDLERS})
 
     def get_embed(self, ctx: Context) -> Embed:
         if not ctx.response.actions.get("embeds"):
@@ -197,7 +208,7 @@ class EmbedBlock(Block):
 
     async def process(self, ctx: Context) -> Optional[str]:
         string = str(ctx.verb.parsed_string).removeprefix("embed.")
-        if match := re.match(r"(?P<name>[^:]+):\s*(?P<value>[^}]+)", string):
+        if match := EMBED_ATTRIBUTE.match(string):
             if match["name"] in self.ATTRIBUTE_HANDLERS:
                 embed = self.get_embed(ctx)
                 self.update_embed(embed, match["name"], match["value"])